@@ -1,4 +1,5 @@
 from pydantic_settings import BaseSettings
+from typing import Dict
 from functools import lru_cache
 
 class Settings(BaseSettings):
@@ -7,6 +8,49 @@ class Settings(BaseSettings):
     SECRET_KEY: str = ""  # Must be set via GADI_SECRET_KEY environment variable
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     BOOTSTRAP_SECRET: str = ""  # Required for bootstrap seeding in production
+    DB_ASYNC: bool = False  # True serves employees/schedules/tasks/users through AsyncSession
+    ASYNC_DATABASE_URL: str = ""  # Defaults to DATABASE_URL with the aiosqlite driver
+    READ_DATABASE_URL: str = ""  # Replica serving the GET handlers; empty reads from DATABASE_URL
+    ASYNC_READ_DATABASE_URL: str = ""  # Defaults to READ_DATABASE_URL with the aiosqlite driver
+    READ_SQLITE_READONLY: bool = False  # Without READ_DATABASE_URL, read the SQLite file through its own mode=ro pool
+    READ_YOUR_WRITES_SECONDS: float = 5  # A client's reads stay on the primary this long after it commits; 0 disables
+    DB_PROFILE: str = "production"  # 'production' applies the SQLite pragmas below; 'default' keeps SQLite defaults
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 65536  # Per connection page cache
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a pooled connection
+    DB_AUTO_MIGRATE: bool = True  # Apply pending migrations at startup; set false once deploys run python -m app.migrations upgrade
+    DB_MIGRATE_LOCK_TIMEOUT_SECONDS: float = 300  # How long a worker waits for another process to finish migrating
+    SCHEDULE_UNIQUE_SLOT: bool = False  # Enforce one schedule per (empleado_id, fecha, turno)
+    SCHEDULE_CONFLICT_CHECK: bool = True  # Reject double bookings and noche -> mañana with 409
+    SCHEDULE_INDEX_TTL_SECONDS: float = 60  # Reload an employee's slots after this long
+    SCHEDULE_INDEX_WINDOW_DAYS: int = 31  # Days loaded on each side of the dates being written
+    SCHEDULE_INDEX_MAX_EMPLOYEES: int = 1024  # Employees kept in the conflict index per worker (LRU)
+    PRINCIPAL_CACHE_SIZE: int = 1024  # Authenticated users kept in memory per worker
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60  # Bounds staleness of role changes made on other workers
+    PASSWORD_POOL_WORKERS: int = 2  # Threads dedicated to bcrypt per worker process
+    PASSWORD_POOL_MAX_PENDING: int = 32  # Queued + running hashes before answering 503
+    PASSWORD_POOL_RETRY_AFTER: int = 2  # Seconds sent in Retry-After when saturated
+    TOKEN_CACHE_ENABLED: bool = True  # Kill switch for the verified-token cache
+    TOKEN_CACHE_SIZE: int = 4096  # Verified tokens kept per worker
+    JWT_EMBED_CLAIMS: bool = False  # Put role/employee_id/nombre/token_version in access tokens
+    TOKEN_VERSION_TTL_SECONDS: float = 30  # Bounds how long another worker honours a revoked token
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    REVOCATION_BLOOM_CAPACITY: int = 100000  # Revoked refresh tokens before the filter degrades
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001  # Share of lookups that fall through to the table
+    REVOCATION_SYNC_SECONDS: float = 30  # Pull revocations made by other workers this often
+    RESPONSE_CACHE_ENABLED: bool = True  # Kill switch for the task/employee response cache
+    RESPONSE_CACHE_SIZE: int = 256  # Cached responses per table per worker
+    RESPONSE_CACHE_TTL_SECONDS: float = 300
+    SHIFT_HOURS: Dict[str, float] = {"mañana": 8.0, "tarde": 8.0, "noche": 8.0}  # JSON in GADI_SHIFT_HOURS
+    METRICS_ENABLED: bool = True  # Per-route latency and DB query metrics served on /metrics
+    SQL_SLOW_QUERY_MS: float = 200  # Log statements slower than this to app.sql.slow; 0 disables
+    SQL_TRACE_MAX_STATEMENTS: int = 200  # Statements kept per request for tracing and query budgets
     
     def model_post_init(self, __context):
         if not self.SECRET_KEY:
@@ -18,6 +62,11 @@ class Settings(BaseSettings):
         if self.APP_ENV != "local" and not self.BOOTSTRAP_SECRET:
             # In production, require bootstrap secret for database initialization
             pass  # BOOTSTRAP_SECRET is optional but recommended
+        
+        if not self.ASYNC_DATABASE_URL and self.DATABASE_URL.startswith("sqlite://"):
+            self.ASYNC_DATABASE_URL = self.DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        if not self.ASYNC_READ_DATABASE_URL and self.READ_DATABASE_URL.startswith("sqlite://"):
+            self.ASYNC_READ_DATABASE_URL = self.READ_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
     
     class Config:
         env_prefix = "GADI_"
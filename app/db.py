@@ -1,18 +1,220 @@
-from sqlmodel import SQLModel, create_engine, Session
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.cache import TTLCache
 from app.config import get_settings
+from app.metrics import parameters_shape, request_stats
+from app.migrations import check_schema
 
+slow_query_logger = logging.getLogger("app.sql.slow")
 settings = get_settings()
-engine = create_engine(
-    settings.DATABASE_URL, 
-    echo=False,
-    connect_args={"check_same_thread": False}
+SLOW_QUERY_SECONDS = settings.SQL_SLOW_QUERY_MS / 1000
+RECENT_WRITERS_SIZE = 10_000  # Clients remembered per worker for read-your-writes
+
+
+def _is_file_sqlite(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and not url.endswith("://")
+
+
+def _readonly_sqlite_url(url: str) -> str:
+    """The same SQLite file opened as a read-only URI (file:/abs/path?mode=ro)"""
+    parsed = make_url(url)
+    path = quote(os.path.abspath(parsed.database))
+    return parsed.set(database=f"file:{path}", query={"mode": "ro", "uri": "true"}).render_as_string()
+
+
+def _sqlite_pragmas(read_only: bool = False) -> list:
+    """PRAGMA statements run on every new SQLite connection for the production profile
+
+    Read-only connections skip journal_mode: changing it needs a write, and the
+    primary already set it in the file.
+    """
+    pragmas = [] if read_only else [f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}"]
+    return pragmas + [
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",  # Negative means KiB, not pages
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA temp_store={settings.SQLITE_TEMP_STORE}",
+    ]
+
+
+def _pragma_listener(read_only: bool):
+    pragmas = _sqlite_pragmas(read_only)
+
+    def apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    return apply_sqlite_pragmas
+
+
+def _engine_options(url: str, pool_class) -> dict:
+    options = {"echo": False}
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+    if not url.startswith("sqlite") or _is_file_sqlite(url):
+        options.update(
+            poolclass=pool_class,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, which dies with the statement even when it fails
+    if context is not None and (SLOW_QUERY_SECONDS or request_stats() is not None):
+        context._gadi_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_gadi_query_start", None)
+    if start is None:
+        return
+    context._gadi_query_start = None
+    elapsed = time.perf_counter() - start
+    stats = request_stats()
+    shape = None
+    if stats is not None:
+        shape = parameters_shape(parameters, executemany)
+        stats.record(statement, elapsed, shape)
+    if SLOW_QUERY_SECONDS and elapsed >= SLOW_QUERY_SECONDS:
+        slow_query_logger.warning(
+            "Consulta lenta: %.1f ms, %s, %s: %s",
+            elapsed * 1000,
+            shape or parameters_shape(parameters, executemany),
+            stats.path if stats is not None else "sin petición",
+            " ".join(statement.split())[:1000],
+        )
+
+
+def _configure(sync_engine, url: str, read_only: bool = False) -> None:
+    if settings.DB_PROFILE == "production" and url.startswith("sqlite"):
+        event.listen(sync_engine, "connect", _pragma_listener(read_only))
+    # Cheap when idle: one context variable lookup per statement outside requests and budgets
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+engine = create_engine(settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL, QueuePool))
+_configure(engine, settings.DATABASE_URL)
+
+# GET handlers read through read_engine; it is the primary itself unless a replica
+# (GADI_READ_DATABASE_URL) or a read-only SQLite pool (GADI_READ_SQLITE_READONLY) is configured
+READ_DATABASE_URL = settings.READ_DATABASE_URL
+ASYNC_READ_DATABASE_URL = settings.ASYNC_READ_DATABASE_URL
+if not READ_DATABASE_URL and settings.READ_SQLITE_READONLY and _is_file_sqlite(settings.DATABASE_URL):
+    READ_DATABASE_URL = _readonly_sqlite_url(settings.DATABASE_URL)
+    ASYNC_READ_DATABASE_URL = _readonly_sqlite_url(settings.ASYNC_DATABASE_URL)
+
+read_engine = engine
+if READ_DATABASE_URL:
+    read_engine = create_engine(READ_DATABASE_URL, **_engine_options(READ_DATABASE_URL, QueuePool))
+    _configure(read_engine, READ_DATABASE_URL, read_only=True)
+
+# Async engine is only built when DB_ASYNC is enabled so aiosqlite stays optional
+async_engine = None
+async_read_engine = None
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        **_engine_options(settings.ASYNC_DATABASE_URL, AsyncAdaptedQueuePool)
+    )
+    _configure(async_engine.sync_engine, settings.ASYNC_DATABASE_URL)
+
+    async_read_engine = async_engine
+    if ASYNC_READ_DATABASE_URL:
+        async_read_engine = create_async_engine(
+            ASYNC_READ_DATABASE_URL,
+            **_engine_options(ASYNC_READ_DATABASE_URL, AsyncAdaptedQueuePool)
+        )
+        _configure(async_read_engine.sync_engine, ASYNC_READ_DATABASE_URL, read_only=True)
+
+# Read-your-writes: clients that committed recently, by hashed Authorization header.
+# Per worker, so a client balanced onto another worker may still read a lagging replica.
+recent_writers = TTLCache(
+    maxsize=RECENT_WRITERS_SIZE,
+    ttl=settings.READ_YOUR_WRITES_SECONDS,
+    enabled=read_engine is not engine and settings.READ_YOUR_WRITES_SECONDS > 0
 )
 
 
-def get_session():
+def _client_key(request: Request) -> Optional[bytes]:
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    return hashlib.blake2b(authorization.encode(), digest_size=16).digest()
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_writer(session) -> None:
+    key = session.info.get("client")
+    if key is not None:
+        recent_writers.set(key, True)
+
+
+def _reads_from_primary(request: Request) -> bool:
+    if not recent_writers.enabled:
+        return False
+    key = _client_key(request)
+    return key is not None and recent_writers.get(key, False)
+
+
+def read_engine_for(request: Request):
+    """Engine for a read-only request: the replica, or the primary right after the client wrote"""
+    return engine if _reads_from_primary(request) else read_engine
+
+
+def async_read_engine_for(request: Request):
+    return async_engine if _reads_from_primary(request) else async_read_engine
+
+
+def get_session(request: Request):
+    """Read-write session on the primary"""
     with Session(engine) as session:
+        if recent_writers.enabled:
+            session.info["client"] = _client_key(request)
+        yield session
+
+
+def get_read_session(request: Request):
+    """Session for GET handlers; never write through it"""
+    with Session(read_engine_for(request)) as session:
+        yield session
+
+
+async def get_async_session(request: Request):
+    async with AsyncSession(async_engine) as session:
+        if recent_writers.enabled:
+            session.info["client"] = _client_key(request)
+        yield session
+
+
+async def get_async_read_session(request: Request):
+    async with AsyncSession(async_read_engine_for(request)) as session:
         yield session
 
 
 async def init_db():
-    SQLModel.metadata.create_all(engine)
\ No newline at end of file
+    check_schema(engine)
+
+
+async def close_db():
+    if async_engine is not None:
+        await async_engine.dispose()
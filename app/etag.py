@@ -0,0 +1,52 @@
+import hashlib
+import secrets
+from typing import Optional, Type
+
+from fastapi import Request, Response
+from sqlalchemy import update
+from sqlmodel import Session, SQLModel, select
+
+from app.models.table_version import TableVersion
+
+
+def bump_version(session: Session, *models: Type[SQLModel]) -> None:
+    """Bump the version of each model's table in the caller's transaction
+
+    Call before commit so the bump is rolled back together with a failed write.
+    """
+    for model in models:
+        result = session.execute(
+            update(TableVersion)
+            .where(TableVersion.name == model.__tablename__)
+            .values(version=TableVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            # Random start so a recreated database never reuses tags of the old one
+            session.add(TableVersion(name=model.__tablename__, version=secrets.randbelow(2 ** 31)))
+
+
+def current_version(session: Session, model: Type[SQLModel]) -> int:
+    version = session.exec(
+        select(TableVersion.version).where(TableVersion.name == model.__tablename__)
+    ).first()
+    return version or 0
+
+
+def not_modified(request: Request, response: Response, version: int) -> Optional[Response]:
+    """304 response when If-None-Match already names this version of the URL
+
+    Otherwise the ETag is set on the outgoing response and None is returned so
+    the handler goes on to read and serialize the rows.
+    """
+    raw = f"{version}:{request.url.path}?{request.url.query}"
+    etag = 'W/"' + hashlib.sha1(raw.encode()).hexdigest()[:20] + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in tags or etag.removeprefix("W/") in tags:
+            return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -1,15 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import health, employees, auth, schedules, admin_seed, tasks, dev_tools, users
-from app.db import init_db
+from app.routers import health, metrics, employees, auth, schedules, admin_seed, tasks, users, reports
+from app.db import init_db, close_db
+from app.config import get_settings
+from app.metrics import MetricsMiddleware
+from app.serialization import FastJSONResponse
+from app.security.passwords import password_pool
 
-app = FastAPI()
+settings = get_settings()
+
+if settings.DB_ASYNC:
+    from app.routers.aio import employees, reports, schedules, tasks, users
+
+app = FastAPI(default_response_class=FastJSONResponse)
 
 
 @app.on_event("startup")
 async def startup_event():
     await init_db()
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    password_pool().shutdown()
+    await close_db()
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -18,13 +33,23 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost so the recorded latency covers CORS and every router
+app.add_middleware(MetricsMiddleware)
 
 # Include routers
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(employees.router)
 app.include_router(schedules.router)
 app.include_router(tasks.router)
 app.include_router(admin_seed.router)
-app.include_router(dev_tools.router)
-app.include_router(users.router)
\ No newline at end of file
+app.include_router(users.router)
+app.include_router(reports.router)
+
+# Development helpers are neither imported nor routed in production
+if settings.APP_ENV != "prod":
+    from app.routers import dev_tools
+
+    app.include_router(admin_seed.dev_router)
+    app.include_router(dev_tools.router)
@@ -0,0 +1,182 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from app.config import get_settings
+
+# Upper bounds in seconds; the implicit +Inf bucket is the request count
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+MAX_TRACED_STATEMENTS = get_settings().SQL_TRACE_MAX_STATEMENTS
+
+
+class StatementRecord(NamedTuple):
+    statement: str
+    seconds: float
+    parameters: str  # Shape only, e.g. "3 params" or "500x4 executemany"; values are never kept
+
+
+class RequestStats:
+    """Database work done while serving one request, filled in by the engine hooks"""
+
+    __slots__ = ("path", "queries", "db_seconds", "statements")
+
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements: List[StatementRecord] = []
+
+    def record(self, statement: str, seconds: float, parameters: str) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        if len(self.statements) < MAX_TRACED_STATEMENTS:
+            self.statements.append(StatementRecord(statement, seconds, parameters))
+
+
+# Set by the middleware for the duration of a request; sync handlers see it through
+# the threadpool because anyio copies the context into worker threads
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def parameters_shape(parameters, executemany: bool) -> str:
+    """Describe bound parameters without their values"""
+    if executemany:
+        first = parameters[0] if parameters else ()
+        return f"{len(parameters)}x{len(first)} executemany"
+    return f"{len(parameters or ())} params"
+
+
+# Callbacks invoked with (method, route, stats) after every request; see app.query_budget
+request_listeners: List[Callable[[str, str, RequestStats], None]] = []
+
+
+class _RouteSeries:
+    __slots__ = ("buckets", "latency_sum", "count", "queries", "db_seconds", "statuses")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.count = 0
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+
+
+class MetricsRegistry:
+    """Per (method, route template) counters and latency histogram for /metrics"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._series: Dict[Tuple[str, str], _RouteSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            series = self._series.get((method, route))
+            if series is None:
+                series = self._series[(method, route)] = _RouteSeries()
+            series.buckets[bucket] += 1
+            series.latency_sum += seconds
+            series.count += 1
+            series.queries += stats.queries
+            series.db_seconds += stats.db_seconds
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        with self._lock:
+            snapshot = [
+                (method, route, series.count, series.latency_sum, list(series.buckets),
+                 series.queries, series.db_seconds, dict(series.statuses))
+                for (method, route), series in sorted(self._series.items())
+            ]
+
+        requests: List[str] = []
+        latency: List[str] = []
+        queries: List[str] = []
+        db_time: List[str] = []
+        for method, route, count, latency_sum, buckets, n_queries, db_seconds, statuses in snapshot:
+            labels = f'method="{_escape(method)}",route="{_escape(route)}"'
+            for code, n in sorted(statuses.items()):
+                requests.append(f'gadi_http_requests_total{{{labels},status="{code}"}} {n}')
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, buckets):
+                cumulative += n
+                latency.append(f'gadi_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            latency.append(f'gadi_http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            latency.append(f"gadi_http_request_duration_seconds_sum{{{labels}}} {latency_sum:.6f}")
+            latency.append(f"gadi_http_request_duration_seconds_count{{{labels}}} {count}")
+            queries.append(f"gadi_db_queries_total{{{labels}}} {n_queries}")
+            db_time.append(f"gadi_db_query_duration_seconds_total{{{labels}}} {db_seconds:.6f}")
+
+        lines = [
+            "# HELP gadi_http_requests_total Requests served by route template and status code",
+            "# TYPE gadi_http_requests_total counter",
+            *requests,
+            "# HELP gadi_http_request_duration_seconds Request latency by route template",
+            "# TYPE gadi_http_request_duration_seconds histogram",
+            *latency,
+            "# HELP gadi_db_queries_total SQL statements executed while serving the route",
+            "# TYPE gadi_db_queries_total counter",
+            *queries,
+            "# HELP gadi_db_query_duration_seconds_total Time spent in SQL statements while serving the route",
+            "# TYPE gadi_db_query_duration_seconds_total counter",
+            *db_time,
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = MetricsRegistry(enabled=get_settings().METRICS_ENABLED)
+
+
+class MetricsMiddleware:
+    """Plain ASGI middleware (no BaseHTTPMiddleware task/stream overhead) feeding the registry"""
+
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (self.registry.enabled or request_listeners):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats(scope["path"])
+        token = _request_stats.set(stats)
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            # The router stores the matched route in the scope, giving /employees/{employee_id} not /employees/7
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE
+            if self.registry.enabled:
+                self.registry.observe(scope["method"], template, status_code, elapsed, stats)
+            for listener in list(request_listeners):
+                listener(scope["method"], template, stats)
@@ -0,0 +1,177 @@
+"""Versioned schema migrations
+
+Each mNNNN_<name> module has an upgrade(connection) that takes the schema from
+version NNNN - 1 to NNNN. The applied versions are recorded in schema_version.
+Run the pending migrations once, before starting the workers:
+
+    python -m app.migrations upgrade
+
+At startup each worker only reads the stored version (check_schema). Migrations
+define the tables they create with their own frozen Table copies, never the
+models, so a shipped migration keeps doing the same thing as the models change.
+They must also stay idempotent, because databases created by create_all before
+this package existed start at version 0 and replay all of them.
+"""
+import logging
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select, text
+from sqlalchemy.exc import IntegrityError, OperationalError, ProgrammingError
+from sqlalchemy.schema import CreateTable
+
+from app.config import get_settings
+from app.migrations import (
+    m0001_initial,
+    m0002_schedule_indexes,
+    m0003_token_revocation,
+    m0004_table_versions,
+    m0005_schedule_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+# Append new migrations at the end; never renumber or edit one that has shipped
+MIGRATIONS = [
+    (1, m0001_initial),
+    (2, m0002_schedule_indexes),
+    (3, m0003_token_revocation),
+    (4, m0004_table_versions),
+    (5, m0005_schedule_summary),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+SCHEDULE_SLOT_INDEX = "ux_schedule_empleado_fecha_turno"
+PG_LOCK_KEY = 7_346_119  # Arbitrary key for pg_advisory_xact_lock
+LOCK_RETRY_SECONDS = 0.5
+
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def schema_version(connection) -> int:
+    """Highest applied migration, 0 for databases that predate schema_version"""
+    try:
+        return connection.execute(select(func.max(schema_version_table.c.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        connection.rollback()
+        return 0
+
+
+def _lock(connection) -> None:
+    """Serialize upgrades from several processes until the transaction ends
+
+    On SQLite the first write statement takes the database write lock, even
+    when it matches no rows. Postgres uses a transaction-scoped advisory lock.
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PG_LOCK_KEY})
+    else:
+        table = schema_version_table
+        connection.execute(table.update().where(table.c.version < 0).values(version=table.c.version))
+
+
+def _apply(engine, version: int, module) -> bool:
+    """Run one migration and record it in the same transaction; False if another process already did"""
+    with engine.begin() as connection:
+        _lock(connection)
+        done = connection.execute(
+            select(schema_version_table.c.version).where(schema_version_table.c.version == version)
+        ).first()
+        if done:
+            return False
+        module.upgrade(connection)
+        connection.execute(insert(schema_version_table).values(
+            version=version,
+            name=module.__name__.rsplit(".", 1)[-1],
+            applied_at=datetime.now(timezone.utc),
+        ))
+    return True
+
+
+def ensure_unique_slot(connection) -> None:
+    """Create the optional one-schedule-per-slot index when GADI_SCHEDULE_UNIQUE_SLOT is on
+
+    It depends on configuration, not on the schema version, so every upgrade run checks it.
+    """
+    if not get_settings().SCHEDULE_UNIQUE_SLOT:
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(text(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {SCHEDULE_SLOT_INDEX} "
+                "ON schedule (empleado_id, fecha, turno)"
+            ))
+    except IntegrityError:
+        logger.warning(
+            "No se pudo crear %s: existen horarios duplicados por empleado/fecha/turno",
+            SCHEDULE_SLOT_INDEX,
+        )
+
+
+def _retry_while_locked(fn, deadline: float):
+    """Call fn until it stops failing because another process holds the SQLite lock"""
+    while True:
+        try:
+            return fn()
+        except OperationalError as exc:
+            # busy_timeout is shorter than a long migration run by another worker; keep waiting
+            if "locked" not in str(exc) or time.monotonic() > deadline:
+                raise
+            time.sleep(LOCK_RETRY_SECONDS)
+
+
+def _create_version_table(engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(CreateTable(schema_version_table, if_not_exists=True))
+
+
+def _ensure_unique_slot(engine) -> None:
+    with engine.begin() as connection:
+        ensure_unique_slot(connection)
+
+
+def upgrade(engine, target: Optional[int] = None) -> List[int]:
+    """Apply the pending migrations up to target (default: all) and return the versions applied"""
+    deadline = time.monotonic() + get_settings().DB_MIGRATE_LOCK_TIMEOUT_SECONDS
+    _retry_while_locked(lambda: _create_version_table(engine), deadline)
+
+    applied = []
+    for version, module in MIGRATIONS:
+        if target is not None and version > target:
+            break
+        if _retry_while_locked(lambda: _apply(engine, version, module), deadline):
+            applied.append(version)
+            logger.info("Migración %s aplicada", module.__name__)
+
+    _retry_while_locked(lambda: _ensure_unique_slot(engine), deadline)
+    return applied
+
+
+def check_schema(engine) -> None:
+    """Startup check: one query comparing the stored version with LATEST_VERSION
+
+    Outdated databases are upgraded in place when GADI_DB_AUTO_MIGRATE is on and
+    rejected otherwise, so workers never serve an older schema. The optional
+    unique slot index follows configuration rather than the version, so it is
+    created here whenever GADI_SCHEDULE_UNIQUE_SLOT is on.
+    """
+    with engine.connect() as connection:
+        version = schema_version(connection)
+    if version >= LATEST_VERSION:
+        if get_settings().SCHEDULE_UNIQUE_SLOT:
+            deadline = time.monotonic() + get_settings().DB_MIGRATE_LOCK_TIMEOUT_SECONDS
+            _retry_while_locked(lambda: _ensure_unique_slot(engine), deadline)
+        return
+    if not get_settings().DB_AUTO_MIGRATE:
+        raise RuntimeError(
+            f"El esquema de la base de datos está en la versión {version} y la aplicación "
+            f"requiere la {LATEST_VERSION}: ejecute python -m app.migrations upgrade"
+        )
+    upgrade(engine)
@@ -0,0 +1,29 @@
+import argparse
+
+from app.migrations import LATEST_VERSION, MIGRATIONS, schema_version, upgrade
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Migraciones del esquema de la base de datos")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    up = subcommands.add_parser("upgrade", help="aplica las migraciones pendientes")
+    up.add_argument("--to", type=int, default=None, help="versión final (por defecto la última)")
+    subcommands.add_parser("status", help="muestra la versión actual y las pendientes")
+    args = parser.parse_args()
+
+    from app.db import engine
+
+    if args.command == "upgrade":
+        applied = upgrade(engine, args.to)
+        print(f"Migraciones aplicadas: {applied or 'ninguna'}")
+
+    with engine.connect() as connection:
+        version = schema_version(connection)
+    pending = [module.__name__.rsplit(".", 1)[-1] for v, module in MIGRATIONS if v > version]
+    print(f"Versión del esquema: {version} (última: {LATEST_VERSION})")
+    if pending:
+        print(f"Pendientes: {', '.join(pending)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Employees, tasks, schedules and users, the tables of the first release
+
+The tables are frozen copies of the first release's models, not the models
+themselves, so this migration never changes: later model changes ship as their
+own migrations.
+"""
+from sqlalchemy import (
+    Boolean, Column, Date, Enum, ForeignKey, Integer, MetaData, String, Table, UniqueConstraint
+)
+
+metadata = MetaData()
+
+# Enum columns store member names, as SQLModel maps them
+role_enum = Enum("TRABAJADOR", "ENCARGADO", "ADMINISTRADOR", name="roleenum")
+turno_enum = Enum("manana", "tarde", "noche", name="turnoenum")
+
+Table(
+    "employee",
+    metadata,
+    Column("nombre", String, nullable=False),
+    Column("email", String, nullable=False),
+    Column("role", role_enum, nullable=False),
+    Column("id", Integer, primary_key=True),
+    UniqueConstraint("email"),
+)
+
+Table(
+    "task",
+    metadata,
+    Column("nombre", String, nullable=False),
+    Column("descripcion", String),
+    Column("activo", Boolean, nullable=False),
+    Column("id", Integer, primary_key=True),
+)
+
+Table(
+    "schedule",
+    metadata,
+    Column("fecha", Date, nullable=False),
+    Column("turno", turno_enum, nullable=False),
+    Column("empleado_id", Integer, ForeignKey("employee.id"), nullable=False),
+    Column("task_id", Integer, ForeignKey("task.id")),
+    Column("id", Integer, primary_key=True),
+)
+
+Table(
+    "user",
+    metadata,
+    Column("email", String, nullable=False),
+    Column("nombre", String, nullable=False),
+    Column("role", role_enum, nullable=False),
+    Column("employee_id", Integer, ForeignKey("employee.id")),
+    Column("id", Integer, primary_key=True),
+    Column("password_hash", String, nullable=False),
+    UniqueConstraint("email"),
+)
+
+
+def upgrade(connection) -> None:
+    metadata.create_all(connection)
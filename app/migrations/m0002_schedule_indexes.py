@@ -0,0 +1,13 @@
+"""Indexes behind the schedule list filters, for gadi.db files created without them"""
+from sqlalchemy import text
+
+INDEXES = {
+    "ix_schedule_empleado_fecha": "empleado_id, fecha",
+    "ix_schedule_fecha_turno": "fecha, turno",
+    "ix_schedule_fecha_id": "fecha, id",  # Keyset pagination order
+}
+
+
+def upgrade(connection) -> None:
+    for name, columns in INDEXES.items():
+        connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON schedule ({columns})"))
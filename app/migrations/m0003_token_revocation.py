@@ -0,0 +1,24 @@
+"""user.token_version and the revoked refresh token table"""
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, inspect, text
+
+metadata = MetaData()
+
+Table(
+    "revoked_token",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("jti", String, nullable=False),
+    Column("user_id", Integer, nullable=False),
+    Column("expires_at", DateTime, nullable=False),
+    Column("revoked_at", DateTime, nullable=False),
+    Index("ix_revoked_token_jti", "jti", unique=True),
+    Index("ix_revoked_token_user_id", "user_id"),
+)
+
+
+def upgrade(connection) -> None:
+    # Databases created by create_all before migrations existed may already have the column
+    columns = {c["name"] for c in inspect(connection).get_columns("user")}
+    if "token_version" not in columns:
+        connection.execute(text('ALTER TABLE "user" ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0'))
+    metadata.create_all(connection)
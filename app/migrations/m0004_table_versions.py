@@ -0,0 +1,15 @@
+"""Per-table version counters behind ETags and the response cache"""
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+metadata = MetaData()
+
+Table(
+    "table_version",
+    metadata,
+    Column("name", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+
+
+def upgrade(connection) -> None:
+    metadata.create_all(connection)
@@ -0,0 +1,66 @@
+"""Aggregate tables for GET /schedules/summary, built from the existing schedules"""
+from collections import Counter
+from datetime import date
+
+from sqlalchemy import Column, Date, Enum, Integer, MetaData, Table, insert, select, text
+
+metadata = MetaData()
+turno_enum = Enum("manana", "tarde", "noche", name="turnoenum")
+
+day_summary = Table(
+    "schedule_day_summary",
+    metadata,
+    Column("fecha", Date, primary_key=True),
+    Column("turno", turno_enum, primary_key=True),
+    Column("total", Integer, nullable=False),
+)
+
+employee_month_summary = Table(
+    "schedule_employee_month_summary",
+    metadata,
+    Column("month", Date, primary_key=True),
+    Column("empleado_id", Integer, primary_key=True),
+    Column("turno", turno_enum, primary_key=True),
+    Column("total", Integer, nullable=False),
+)
+
+MONTH_START = {
+    "sqlite": "date(fecha, 'start of month')",
+    "postgresql": "CAST(date_trunc('month', fecha) AS DATE)",
+}
+
+
+def _backfill_months(connection) -> None:
+    month = MONTH_START.get(connection.dialect.name)
+    if month is not None:
+        connection.execute(text(
+            "INSERT INTO schedule_employee_month_summary (month, empleado_id, turno, total) "
+            f"SELECT {month}, empleado_id, turno, count(*) FROM schedule GROUP BY 1, empleado_id, turno"
+        ))
+        return
+    months: Counter = Counter()
+    rows = connection.execute(text(
+        "SELECT empleado_id, fecha, turno, count(*) FROM schedule GROUP BY empleado_id, fecha, turno"
+    ))
+    for empleado_id, fecha, turno, count in rows:
+        fecha = fecha if isinstance(fecha, date) else date.fromisoformat(fecha)
+        months[(fecha.replace(day=1), empleado_id, turno)] += count
+    if months:
+        connection.execute(insert(employee_month_summary), [
+            {"month": month, "empleado_id": empleado_id, "turno": turno, "total": total}
+            for (month, empleado_id, turno), total in months.items()
+        ])
+
+
+def upgrade(connection) -> None:
+    metadata.create_all(connection)
+    # Databases whose schedules predate the summary get it built once
+    if connection.execute(select(day_summary.c.fecha).limit(1)).first() is not None:
+        return
+    if connection.execute(text("SELECT id FROM schedule LIMIT 1")).first() is None:
+        return
+    connection.execute(text(
+        "INSERT INTO schedule_day_summary (fecha, turno, total) "
+        "SELECT fecha, turno, count(*) FROM schedule GROUP BY fecha, turno"
+    ))
+    _backfill_months(connection)
@@ -0,0 +1,30 @@
+from datetime import date
+from enum import Enum
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from app.models.schedule import TurnoEnum
+
+
+class WorkloadPeriod(str, Enum):
+    week = "week"  # periodo is the Monday of the week
+    month = "month"  # periodo is the first day of the month
+
+
+class WorkloadRow(BaseModel):
+    empleado_id: int
+    nombre: str
+    periodo: date
+    turnos: Dict[TurnoEnum, int]
+    horas: Dict[TurnoEnum, float]
+    total_turnos: int
+    total_horas: float
+
+
+class WorkloadReport(BaseModel):
+    period: WorkloadPeriod
+    fecha_from: date
+    fecha_to: date
+    shift_hours: Dict[TurnoEnum, float]
+    rows: List[WorkloadRow]
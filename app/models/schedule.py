@@ -1,7 +1,8 @@
 from datetime import date
-from typing import Optional
+from typing import Dict, List, Optional
 from enum import Enum
-from sqlmodel import SQLModel, Field
+from pydantic import BaseModel, conlist
+from sqlmodel import SQLModel, Field, Index
 
 
 class TurnoEnum(str, Enum):
@@ -19,6 +20,12 @@ class ScheduleBase(SQLModel):
 
 class Schedule(ScheduleBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
+    
+    __table_args__ = (
+        Index("ix_schedule_empleado_fecha", "empleado_id", "fecha"),
+        Index("ix_schedule_fecha_turno", "fecha", "turno"),
+        Index("ix_schedule_fecha_id", "fecha", "id"),  # Keyset pagination order
+    )
 
 
 class ScheduleCreate(ScheduleBase):
@@ -33,4 +40,85 @@ class ScheduleUpdate(SQLModel):
     fecha: Optional[date] = None
     turno: Optional[TurnoEnum] = None
     empleado_id: Optional[int] = None
-    task_id: Optional[int] = None
\ No newline at end of file
+    task_id: Optional[int] = None
+
+
+MAX_BULK_SCHEDULES = 5000
+
+
+class ScheduleBulkCreate(BaseModel):
+    items: conlist(ScheduleCreate, min_length=1, max_length=MAX_BULK_SCHEDULES)
+    partial: bool = False  # Insert the valid items and report the rest instead of rejecting the batch
+
+
+class ScheduleBulkError(BaseModel):
+    index: int
+    detail: str
+
+
+class ScheduleBulkResult(BaseModel):
+    created: int
+    ids: List[int]
+    errors: List[ScheduleBulkError] = []
+
+
+class RosterRequest(BaseModel):
+    fecha_from: date
+    fecha_to: date
+    empleado_ids: Optional[List[int]] = None  # Defaults to every employee
+    coverage: Dict[TurnoEnum, int] = {TurnoEnum.manana: 1, TurnoEnum.tarde: 1, TurnoEnum.noche: 1}
+    max_shifts_per_week: int = 5
+    task_id: Optional[int] = None
+    dry_run: bool = False  # Plan only, do not write
+
+
+class RosterShortfall(BaseModel):
+    fecha: date
+    turno: TurnoEnum
+    missing: int
+
+
+class RosterResult(BaseModel):
+    created: int
+    ids: List[int] = []
+    items: List[ScheduleCreate] = []
+    shortfalls: List[RosterShortfall] = []
+
+
+class ScheduleDaySummary(SQLModel, table=True):
+    """Schedules per (fecha, turno), kept up to date by every schedule write"""
+    __tablename__ = "schedule_day_summary"
+
+    fecha: date = Field(primary_key=True)
+    turno: TurnoEnum = Field(primary_key=True)
+    total: int = 0
+
+
+class ScheduleEmployeeMonthSummary(SQLModel, table=True):
+    """Schedules per (first day of month, empleado_id, turno)"""
+    __tablename__ = "schedule_employee_month_summary"
+
+    month: date = Field(primary_key=True)
+    empleado_id: int = Field(primary_key=True)
+    turno: TurnoEnum = Field(primary_key=True)
+    total: int = 0
+
+
+class SummaryGroup(str, Enum):
+    day = "day"
+    week = "week"  # fecha is the Monday of the week
+    employee = "employee"
+
+
+class ScheduleSummaryItem(BaseModel):
+    fecha: Optional[date] = None
+    empleado_id: Optional[int] = None
+    counts: Dict[TurnoEnum, int]
+    total: int
+
+
+class ScheduleSummary(BaseModel):
+    group: SummaryGroup
+    fecha_from: date
+    fecha_to: date
+    items: List[ScheduleSummaryItem]
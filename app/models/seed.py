@@ -0,0 +1,14 @@
+from datetime import date
+from pydantic import BaseModel, Field
+
+
+class SyntheticSeed(BaseModel):
+    employees: int = Field(100, ge=1, le=100000)
+    tasks: int = Field(20, ge=0, le=10000)
+    users: int = Field(10, ge=0, le=100000)  # The first one is an Administrador
+    days: int = Field(30, ge=1, le=3660)
+    start: date = date(2024, 1, 1)  # Fixed, not today, so a seed gives the same dates on any day
+    occupancy: float = Field(5 / 7, ge=0, le=1)  # Share of employees working each day
+    seed: int = 0  # Same seed and parameters -> same database
+    password: str = "1234"  # For every generated user, hashed once
+    reset: bool = True  # Delete schedules, employees, tasks and generated users first
@@ -0,0 +1,8 @@
+from sqlmodel import SQLModel, Field
+
+
+class TableVersion(SQLModel, table=True):
+    __tablename__ = "table_version"
+
+    name: str = Field(primary_key=True)
+    version: int = 0
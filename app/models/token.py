@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+from sqlmodel import SQLModel, Field
+
+
+class RevokedToken(SQLModel, table=True):
+    __tablename__ = "revoked_token"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    jti: str = Field(unique=True, index=True)
+    user_id: int = Field(index=True)
+    expires_at: datetime  # Rows are purged once the token could no longer be used anyway
+    revoked_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
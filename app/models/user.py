@@ -14,6 +14,7 @@ class UserBase(SQLModel):
 class User(UserBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     password_hash: str
+    token_version: int = Field(default=0)  # Bumped to revoke every token issued so far
 
 
 class UserCreate(UserBase):
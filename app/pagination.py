@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import date
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Opaque cursor for the last row of a page"""
+    raw = json.dumps([v.isoformat() if isinstance(v, date) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> list:
+    """Decode a cursor back into typed values matching the keyset columns"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if python_type is date:
+                decoded.append(date.fromisoformat(value))
+            else:
+                decoded.append(python_type(value))
+        return decoded
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+def keyset(query, columns: Sequence, cursor: Optional[str], limit: int):
+    """Order by the keyset columns, start after the cursor and fetch one extra row"""
+    if cursor is not None:
+        values = decode_cursor(cursor, columns)
+        if len(columns) == 1:
+            query = query.where(columns[0] > values[0])
+        else:
+            query = query.where(tuple_(*columns) > tuple(values))
+    return query.order_by(*columns).limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence,
+    columns: Sequence,
+    limit: int,
+    transform: Optional[Callable] = None
+) -> Page:
+    """Turn the limit + 1 rows returned by keyset() into a Page"""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in columns])
+    if transform is not None:
+        items = [transform(item) for item in items]
+    return Page(items=items, next_cursor=next_cursor)
@@ -0,0 +1,61 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+from app.metrics import RequestStats, request_listeners
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by query_budget when a request ran more SQL statements than allowed"""
+
+
+class QueryCapture:
+    """Requests served while a query_budget block is active, with their statements"""
+
+    def __init__(self):
+        self.requests: List[Tuple[str, str, RequestStats]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, method: str, route: str, stats: RequestStats) -> None:
+        with self._lock:
+            self.requests.append((method, route, stats))
+
+    @property
+    def queries(self) -> int:
+        return sum(stats.queries for _, _, stats in self.requests)
+
+    def report(self) -> str:
+        lines = []
+        for method, route, stats in self.requests:
+            lines.append(f"{method} {route}: {stats.queries} consultas, {stats.db_seconds * 1000:.1f} ms")
+            for record in stats.statements:
+                lines.append(f"    {record.seconds * 1000:7.2f} ms  {record.parameters:<20} {' '.join(record.statement.split())}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def query_budget(max_queries: int, route: Optional[str] = None) -> Iterator[QueryCapture]:
+    """Fail when any request served inside the block runs more than max_queries statements
+
+    Works with TestClient and httpx.ASGITransport alike because the metrics middleware
+    reports every request. route restricts the check to one route template:
+
+        with query_budget(3, route="/tasks/{task_id}"):
+            client.get("/tasks/1", headers=headers)
+    """
+    capture = QueryCapture()
+    request_listeners.append(capture)
+    try:
+        yield capture
+    finally:
+        request_listeners.remove(capture)
+
+    over = [
+        (method, path, stats) for method, path, stats in capture.requests
+        if stats.queries > max_queries and (route is None or path == route)
+    ]
+    if over:
+        method, path, stats = over[0]
+        raise QueryBudgetExceeded(
+            f"{method} {path} ejecutó {stats.queries} consultas (máximo {max_queries})\n{capture.report()}"
+        )
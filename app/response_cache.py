@@ -0,0 +1,58 @@
+from typing import Any, Callable, Dict, Optional, Type
+
+from fastapi import Request
+from sqlmodel import SQLModel
+
+from app.cache import TTLCache
+from app.config import get_settings
+
+
+class ResponseCache:
+    """Pre-serialized JSON bodies per table, keyed by table version and URL
+
+    Keying on the version from app.etag means a write on any worker makes the
+    old entries unreachable; the write handlers of this process also drop their
+    table's entries right away so they don't linger until the TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self._tables: Dict[str, TTLCache] = {}
+
+    def _table(self, model: Type[SQLModel]) -> TTLCache:
+        name = model.__tablename__
+        if name not in self._tables:
+            self._tables[name] = TTLCache(maxsize=self.maxsize, ttl=self.ttl, enabled=self.enabled)
+        return self._tables[name]
+
+    def get(self, model: Type[SQLModel], version: int, request: Request) -> Optional[bytes]:
+        return self._table(model).get((version, request.url.path, request.url.query))
+
+    def put(
+        self,
+        model: Type[SQLModel],
+        version: int,
+        request: Request,
+        serialize: Callable[[Any], bytes],
+        value: Any
+    ) -> bytes:
+        """Serialize value (e.g. with app.serialization.task_json.page) and keep the bytes"""
+        body = serialize(value)
+        self._table(model).set((version, request.url.path, request.url.query), body)
+        return body
+
+    def invalidate(self, model: Type[SQLModel]) -> None:
+        self._table(model).clear()
+
+    def stats(self) -> dict:
+        return {name: cache.stats() for name, cache in self._tables.items()}
+
+
+settings = get_settings()
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_SIZE,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED
+)
@@ -1,15 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session, select
 from app.db import get_session
-from app.security.deps import require_roles
-from app.seed import seed_all
+from app.security.deps import principal_cache, require_roles
+from app.security.jwt import token_cache
+from app.security.revocation import revocation_store
+from app.response_cache import response_cache
+from app.seed import seed_all, seed_synthetic
+from app.models.seed import SyntheticSeed
 from app.models.user import User
 from app.config import get_settings
 
 router = APIRouter(prefix="/admin", tags=["admin"])
+# Data-generating endpoints, only registered outside APP_ENV=prod
+dev_router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-@router.post("/seed")
+@dev_router.post("/seed")
 def seed_database(session: Session = Depends(get_session)):
     """Seeds the database with realistic demo data for development/testing
     
@@ -79,4 +85,31 @@ def seed_database_admin(
     return {
         "ok": True,
         "created": created_counts
-    }
\ No newline at end of file
+    }
+
+
+@dev_router.post("/seed-synthetic")
+def seed_database_synthetic(
+    params: SyntheticSeed,
+    session: Session = Depends(get_session),
+    current_user = Depends(require_roles("Administrador"))
+):
+    """Generate a large deterministic dataset for load testing (Admin only)
+    
+    With reset=true (default) existing schedules, employees and tasks are deleted first.
+    """
+    return {
+        "ok": True,
+        "created": seed_synthetic(session, params)
+    }
+
+
+@router.get("/cache-stats")
+def cache_stats(current_user = Depends(require_roles("Administrador"))):
+    """Hit/miss counters of the in-process caches of this worker"""
+    return {
+        "principal": principal_cache.stats(),
+        "token": token_cache.stats(),
+        "revocation": revocation_store.stats(),
+        "response": response_cache.stats()
+    }
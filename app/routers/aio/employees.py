@@ -0,0 +1,118 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.db import get_async_read_session, get_async_session
+from app.models.employee import Employee, EmployeeCreate, EmployeeRead, EmployeeUpdate
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.routers.employees import EMPLOYEE_KEYSET
+from app.response_cache import response_cache
+from app.serialization import json_response, employee_json
+from app.security.deps import get_current_user_async, require_roles_async
+
+router = APIRouter(prefix="/employees", tags=["employees"])
+
+
+@router.post("/", response_model=EmployeeRead, status_code=201)
+async def create_employee(
+    employee: EmployeeCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    db_employee = Employee.model_validate(employee)
+    session.add(db_employee)
+    try:
+        await session.run_sync(bump_version, Employee)
+        await session.commit()
+        response_cache.invalidate(Employee)
+        await session.refresh(db_employee)
+        return db_employee
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="El correo ya está registrado")
+
+
+@router.get("/", response_model=Page[EmployeeRead])
+async def list_employees(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(get_current_user_async),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
+):
+    version = await session.run_sync(current_version, Employee)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Employee, version, request)
+    if body is None:
+        query = keyset(select(Employee), EMPLOYEE_KEYSET, cursor, limit)
+        employees = (await session.exec(query)).all()
+        page = build_page(employees, EMPLOYEE_KEYSET, limit)
+        body = response_cache.put(Employee, version, request, employee_json.page, page)
+    return json_response(body, response)
+
+
+@router.get("/{employee_id}", response_model=EmployeeRead)
+async def get_employee(
+    employee_id: int, 
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(get_current_user_async)
+):
+    cached = not_modified(request, response, await session.run_sync(current_version, Employee))
+    if cached is not None:
+        return cached
+    employee = await session.get(Employee, employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Empleado no encontrado")
+    return json_response(employee_json.one(employee), response)
+
+
+@router.patch("/{employee_id}", response_model=EmployeeRead)
+async def update_employee(
+    employee_id: int,
+    employee_update: EmployeeUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    employee = await session.get(Employee, employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Empleado no encontrado")
+    
+    employee_data = employee_update.model_dump(exclude_unset=True)
+    for field, value in employee_data.items():
+        setattr(employee, field, value)
+    
+    session.add(employee)
+    try:
+        await session.run_sync(bump_version, Employee)
+        await session.commit()
+        response_cache.invalidate(Employee)
+        await session.refresh(employee)
+        return employee
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="El correo ya está registrado")
+
+
+@router.delete("/{employee_id}")
+async def delete_employee(
+    employee_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    employee = await session.get(Employee, employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Empleado no encontrado")
+    
+    await session.delete(employee)
+    await session.run_sync(bump_version, Employee)
+    await session.commit()
+    response_cache.invalidate(Employee)
+    return {"message": "Empleado eliminado exitosamente"}
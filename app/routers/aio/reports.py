@@ -0,0 +1,30 @@
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import get_async_read_session
+from app.models.report import WorkloadPeriod, WorkloadReport
+from app.routers.reports import workload_response
+from app.services.workload import workload_report
+from app.security.deps import require_roles_async
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/workload", response_model=WorkloadReport)
+async def get_workload(
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador")),
+    fecha_from: date = Query(..., alias="from"),
+    fecha_to: date = Query(..., alias="to"),
+    period: WorkloadPeriod = Query(WorkloadPeriod.week),
+    empleado_id: Optional[int] = Query(None),
+    fmt: Literal["json", "csv"] = Query("json", alias="format")
+):
+    """Shifts and hours per employee and week/month, split by turno
+    
+    Hours per turno come from GADI_SHIFT_HOURS.
+    """
+    report = await session.run_sync(workload_report, fecha_from, fecha_to, period, empleado_id)
+    return workload_response(report, fmt)
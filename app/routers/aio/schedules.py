@@ -0,0 +1,217 @@
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.db import async_read_engine_for, get_async_read_session, get_async_session
+from app.models.schedule import (
+    RosterRequest, RosterResult, Schedule, ScheduleBulkCreate, ScheduleBulkResult, ScheduleCreate,
+    ScheduleRead, ScheduleSummary, ScheduleUpdate, SummaryGroup
+)
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.serialization import json_response, schedule_json
+from app.routers.schedules import SCHEDULE_KEYSET, filter_schedules
+from app.services.roster import generate_roster
+from app.services.schedule_bulk import bulk_create
+from app.services.schedule_conflicts import check_conflicts, conflict_index
+from app.services.schedule_export import (
+    EXPORT_BATCH_SIZE, EXPORT_COLUMNS, MEDIA_TYPES, csv_header, render_batch
+)
+from app.services.schedule_summary import apply_summary, summarize
+from app.security.deps import get_current_user_async, require_roles_async
+
+router = APIRouter(prefix="/schedules", tags=["schedules"])
+
+
+@router.post("/", response_model=ScheduleRead, status_code=201)
+async def create_schedule(
+    schedule: ScheduleCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    db_schedule = Schedule.model_validate(schedule)
+    await session.run_sync(check_conflicts, db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)
+    session.add(db_schedule)
+    try:
+        await session.run_sync(
+            apply_summary, [(db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)]
+        )
+        await session.run_sync(bump_version, Schedule)
+        await session.commit()
+        await session.refresh(db_schedule)
+        conflict_index.add(db_schedule.id, db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)
+        return db_schedule
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Error al crear el horario")
+
+
+@router.post("/bulk", response_model=ScheduleBulkResult, status_code=201)
+async def create_schedules_bulk(
+    payload: ScheduleBulkCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    """Create many schedules in one transaction with a single batched insert
+    
+    The whole batch is rejected with per-item errors unless partial=true, in which
+    case the valid items are inserted and the invalid ones are reported.
+    """
+    return await session.run_sync(bulk_create, payload)
+
+
+@router.post("/generate", response_model=RosterResult, status_code=201)
+async def generate_schedules(
+    request: RosterRequest,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    """Generate a roster for a date range and write it with one batched insert
+    
+    Fills the coverage requested per turno each day, respecting existing schedules,
+    max_shifts_per_week and no mañana right after a noche. dry_run=true returns the
+    plan without writing it.
+    """
+    return await session.run_sync(generate_roster, request)
+
+
+@router.get("/", response_model=Page[ScheduleRead])
+async def list_schedules(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(get_current_user_async),
+    empleado_id: Optional[int] = Query(None),
+    fecha_from: Optional[date] = Query(None),
+    fecha_to: Optional[date] = Query(None),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
+):
+    cached = not_modified(request, response, await session.run_sync(current_version, Schedule))
+    if cached is not None:
+        return cached
+    query = filter_schedules(select(Schedule), empleado_id, fecha_from, fecha_to)
+    query = keyset(query, SCHEDULE_KEYSET, cursor, limit)
+    schedules = (await session.exec(query)).all()
+    return json_response(schedule_json.page(build_page(schedules, SCHEDULE_KEYSET, limit)), response)
+
+
+@router.get("/export")
+async def export_schedules(
+    request: Request,
+    current_user = Depends(get_current_user_async),
+    empleado_id: Optional[int] = Query(None),
+    fecha_from: Optional[date] = Query(None),
+    fecha_to: Optional[date] = Query(None),
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format")
+):
+    """Stream schedules as NDJSON or CSV, one batch of rows at a time"""
+    query = filter_schedules(select(*EXPORT_COLUMNS), empleado_id, fecha_from, fecha_to)
+    query = query.order_by(*SCHEDULE_KEYSET).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    
+    async def generate():
+        # The request session is closed before the body streams, so use our own
+        async with AsyncSession(async_read_engine_for(request)) as session:
+            if fmt == "csv":
+                yield csv_header()
+            result = await session.stream(query)
+            async for rows in result.partitions():
+                yield render_batch(rows, fmt)
+    
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="horarios.{fmt}"'}
+    )
+
+
+@router.get("/summary", response_model=ScheduleSummary)
+async def schedule_summary(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(get_current_user_async),
+    fecha_from: date = Query(..., alias="from"),
+    fecha_to: date = Query(..., alias="to"),
+    group: SummaryGroup = Query(SummaryGroup.day)
+):
+    """Schedules per turno for each day, week or employee in the range, from the aggregate tables"""
+    cached = not_modified(request, response, await session.run_sync(current_version, Schedule))
+    if cached is not None:
+        return cached
+    return await session.run_sync(summarize, fecha_from, fecha_to, group)
+
+
+@router.get("/{schedule_id}", response_model=ScheduleRead)
+async def get_schedule(
+    schedule_id: int, 
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(get_current_user_async)
+):
+    cached = not_modified(request, response, await session.run_sync(current_version, Schedule))
+    if cached is not None:
+        return cached
+    schedule = await session.get(Schedule, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Horario no encontrado")
+    return json_response(schedule_json.one(schedule), response)
+
+
+@router.patch("/{schedule_id}", response_model=ScheduleRead)
+async def update_schedule(
+    schedule_id: int,
+    schedule_update: ScheduleUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    schedule = await session.get(Schedule, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Horario no encontrado")
+    
+    previous = (schedule.empleado_id, schedule.fecha, schedule.turno)
+    schedule_data = schedule_update.model_dump(exclude_unset=True)
+    for field, value in schedule_data.items():
+        setattr(schedule, field, value)
+    
+    await session.run_sync(
+        check_conflicts, schedule.empleado_id, schedule.fecha, schedule.turno, schedule.id
+    )
+    session.add(schedule)
+    try:
+        await session.run_sync(
+            apply_summary, [(schedule.empleado_id, schedule.fecha, schedule.turno)], [previous]
+        )
+        await session.run_sync(bump_version, Schedule)
+        await session.commit()
+        await session.refresh(schedule)
+        conflict_index.remove(schedule.id, *previous)
+        conflict_index.add(schedule.id, schedule.empleado_id, schedule.fecha, schedule.turno)
+        return schedule
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Error al actualizar el horario")
+
+
+@router.delete("/{schedule_id}")
+async def delete_schedule(
+    schedule_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    schedule = await session.get(Schedule, schedule_id)
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Horario no encontrado")
+    
+    slot = (schedule.id, schedule.empleado_id, schedule.fecha, schedule.turno)
+    await session.delete(schedule)
+    await session.run_sync(apply_summary, [], [slot[1:]])
+    await session.run_sync(bump_version, Schedule)
+    await session.commit()
+    conflict_index.remove(*slot)
+    return {"message": "Horario eliminado exitosamente"}
@@ -0,0 +1,125 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from app.db import get_async_read_session, get_async_session
+from app.models.task import Task, TaskCreate, TaskRead, TaskUpdate
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.routers.tasks import TASK_KEYSET
+from app.response_cache import response_cache
+from app.serialization import json_response, task_json
+from app.security.deps import require_roles_async
+
+router = APIRouter(prefix="/tasks", tags=["tasks"])
+
+
+@router.get("/", response_model=Page[TaskRead])
+async def list_tasks(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
+):
+    """List tasks ordered by id, one page at a time"""
+    version = await session.run_sync(current_version, Task)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Task, version, request)
+    if body is None:
+        query = keyset(select(Task), TASK_KEYSET, cursor, limit)
+        tasks = (await session.exec(query)).all()
+        page = build_page(tasks, TASK_KEYSET, limit)
+        body = response_cache.put(Task, version, request, task_json.page, page)
+    return json_response(body, response)
+
+
+@router.get("/{task_id}", response_model=TaskRead)
+async def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_read_session)
+):
+    """Get a specific task by ID"""
+    version = await session.run_sync(current_version, Task)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Task, version, request)
+    if body is None:
+        task = await session.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Tarea no encontrada")
+        body = response_cache.put(Task, version, request, task_json.one, task)
+    return json_response(body, response)
+
+
+@router.post("/", response_model=TaskRead, status_code=201)
+async def create_task(
+    task: TaskCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    """Create a new task (requires Encargado or Administrador role)"""
+    db_task = Task.model_validate(task)
+    session.add(db_task)
+    try:
+        await session.run_sync(bump_version, Task)
+        await session.commit()
+        response_cache.invalidate(Task)
+        await session.refresh(db_task)
+        return db_task
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Error al crear la tarea")
+
+
+@router.patch("/{task_id}", response_model=TaskRead)
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Encargado", "Administrador"))
+):
+    """Update a task (requires Encargado or Administrador role)"""
+    task = await session.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Tarea no encontrada")
+    
+    task_data = task_update.model_dump(exclude_unset=True)
+    for field, value in task_data.items():
+        setattr(task, field, value)
+    
+    session.add(task)
+    try:
+        await session.run_sync(bump_version, Task)
+        await session.commit()
+        response_cache.invalidate(Task)
+        await session.refresh(task)
+        return task
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=400, detail="Error al actualizar la tarea")
+
+
+@router.delete("/{task_id}")
+async def delete_task(
+    task_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Administrador"))
+):
+    """Delete a task (requires Administrador role only)"""
+    task = await session.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Tarea no encontrada")
+    
+    await session.delete(task)
+    await session.run_sync(bump_version, Task)
+    await session.commit()
+    response_cache.invalidate(Task)
+    return {"message": "Tarea eliminada exitosamente"}
@@ -0,0 +1,138 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db import get_async_read_session, get_async_session
+from app.models.user import User, UserCreate, UserRead, UserUpdate
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.routers.users import USER_KEYSET
+from app.security.deps import invalidate_principal, require_roles_async
+from app.security.passwords import hash_password
+from app.serialization import json_response, user_json
+
+router = APIRouter(prefix="/api/v1/users", tags=["users"])
+
+
+@router.get("/", response_model=Page[UserRead])
+async def list_users(
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(require_roles_async("Administrador")),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
+):
+    """List users ordered by id, one page at a time (Admin only)"""
+    query = keyset(select(User), USER_KEYSET, cursor, limit)
+    users = (await session.exec(query)).all()
+    return json_response(user_json.page(build_page(users, USER_KEYSET, limit)))
+
+
+@router.get("/{user_id}", response_model=UserRead)
+async def get_user(
+    user_id: int,
+    session: AsyncSession = Depends(get_async_read_session),
+    current_user = Depends(require_roles_async("Administrador"))
+):
+    """Get user by ID (Admin only)"""
+    user = await session.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuario no encontrado"
+        )
+    
+    return json_response(user_json.one(user))
+
+
+@router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+async def create_user(
+    user_data: UserCreate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Administrador"))
+):
+    """Create new user (Admin only)"""
+    # Check if email already exists
+    existing_user = (await session.exec(
+        select(User).where(User.email == user_data.email)
+    )).first()
+    
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="El correo ya está registrado"
+        )
+    
+    hashed_password = await hash_password(user_data.password)
+    
+    db_user = User(
+        email=user_data.email,
+        nombre=user_data.nombre,
+        role=user_data.role,
+        employee_id=user_data.employee_id,
+        password_hash=hashed_password
+    )
+    
+    session.add(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+    
+    return json_response(user_json.one(db_user), status_code=status.HTTP_201_CREATED)
+
+
+@router.patch("/{user_id}", response_model=UserRead)
+async def update_user(
+    user_id: int,
+    user_update: UserUpdate,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Administrador"))
+):
+    """Update user (Admin only)"""
+    user = await session.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuario no encontrado"
+        )
+    
+    if user_update.nombre is not None:
+        user.nombre = user_update.nombre
+    
+    if user_update.role is not None:
+        user.role = user_update.role
+    
+    if user_update.employee_id is not None:
+        user.employee_id = user_update.employee_id
+    
+    if user_update.password is not None:
+        user.password_hash = await hash_password(user_update.password)
+    
+    # Revoke tokens that embed the old role/nombre/employee_id
+    user.token_version += 1
+    
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    invalidate_principal(user_id)
+    
+    return json_response(user_json.one(user))
+
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(
+    user_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    current_user = Depends(require_roles_async("Administrador"))
+):
+    """Delete user (Admin only)"""
+    user = await session.get(User, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Usuario no encontrado"
+        )
+    
+    await session.delete(user)
+    await session.commit()
+    invalidate_principal(user_id)
+    
+    return None
@@ -1,30 +1,21 @@
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends, status
 from sqlmodel import Session, select
-from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
 from app.db import get_session
 from app.models.user import User, UserLogin, UserPublic, UserRegister, UserBootstrap
 from app.models.employee import RoleEnum
-from app.security.jwt import create_access_token
-from app.security.deps import get_current_user, require_roles
+from app.models.token import RefreshRequest
+from app.security.jwt import create_access_token, create_refresh_token, decode_token
+from app.security.revocation import revocation_store
+from app.security.deps import access_token_claims, get_current_user, invalidate_principal, require_roles
+from app.security.passwords import hash_password_blocking, verify_password
 from app.config import get_settings
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 settings = get_settings()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
-
 
 @router.post("/register")
 def register(
@@ -45,7 +36,7 @@ def register(
         )
     
     # Create new user with hashed password
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = hash_password_blocking(user_data.password)
     db_user = User(
         email=user_data.email,
         nombre=user_data.nombre,
@@ -57,6 +48,7 @@ def register(
     session.add(db_user)
     session.commit()
     session.refresh(db_user)
+    invalidate_principal(db_user.id)
     
     return UserPublic(
         id=db_user.id or 0,
@@ -67,29 +59,39 @@ def register(
     )
 
 
+def _find_user(session: Session, email: str):
+    return session.exec(select(User).where(User.email == email)).first()
+
+
 @router.post("/login")
-def login(user_login: UserLogin, session: Session = Depends(get_session)):
-    """Login with email and password"""
+async def login(user_login: UserLogin, session: Session = Depends(get_session)):
+    """Login with email and password
+    
+    Async so a login burst only waits on the bounded password pool and never
+    holds a threadpool thread during the bcrypt verify.
+    """
     # Find user by email
-    user = session.exec(
-        select(User).where(User.email == user_login.email)
-    ).first()
+    user = await run_in_threadpool(_find_user, session, user_login.email)
     
-    if not user or not verify_password(user_login.password, user.password_hash):
+    if not user or not await verify_password(user_login.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Credenciales inválidas",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Create access token
+    return _token_response(user)
+
+
+def _token_response(user: User) -> dict:
     access_token = create_access_token(
-        data={"sub": str(user.id)},
+        data=access_token_claims(user),
         expires_minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     
     return {
         "access_token": access_token,
+        "refresh_token": create_refresh_token(user.id, user.token_version),
         "token_type": "bearer",
         "user": UserPublic(
             id=user.id or 0,
@@ -101,6 +103,71 @@ def login(user_login: UserLogin, session: Session = Depends(get_session)):
     }
 
 
+def _invalid_refresh() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token de refresco inválido",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _refresh_claims(token: str) -> dict:
+    payload = decode_token(token)
+    if payload.get("type") != "refresh" or not payload.get("jti"):
+        raise _invalid_refresh()
+    try:
+        payload["sub"] = int(payload["sub"])
+        payload["exp"] = datetime.utcfromtimestamp(payload["exp"])
+    except (KeyError, ValueError, TypeError):
+        raise _invalid_refresh()
+    return payload
+
+
+@router.post("/refresh")
+def refresh(request: RefreshRequest, session: Session = Depends(get_session)):
+    """Trade a refresh token for a new access/refresh pair without a bcrypt verify
+    
+    The presented refresh token is revoked, so each one works exactly once.
+    """
+    claims = _refresh_claims(request.refresh_token)
+    if revocation_store.is_revoked(session, claims["jti"]):
+        raise _invalid_refresh()
+
+    user = session.get(User, claims["sub"])
+    if user is None or user.token_version != claims.get("tv"):
+        raise _invalid_refresh()
+
+    if not revocation_store.revoke(session, claims["jti"], user.id, claims["exp"]):
+        raise _invalid_refresh()  # Used concurrently or on another worker
+    return _token_response(user)
+
+
+@router.post("/logout")
+def logout(request: RefreshRequest, session: Session = Depends(get_session)):
+    """Revoke a refresh token; access tokens simply expire"""
+    claims = _refresh_claims(request.refresh_token)
+    revocation_store.revoke(session, claims["jti"], claims["sub"], claims["exp"])
+    return {"ok": True}
+
+
+@router.post("/revoke/{user_id}")
+def revoke_user_tokens(
+    user_id: int,
+    session: Session = Depends(get_session),
+    current_user: UserPublic = Depends(require_roles("Administrador"))
+):
+    """Revoke every refresh token of a user, and access tokens with embedded claims (Admin only)"""
+    user = session.get(User, user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="Usuario no encontrado")
+
+    user.token_version += 1
+    session.add(user)
+    session.commit()
+    invalidate_principal(user_id)
+    return {"ok": True}
+
+
 @router.get("/me", response_model=UserPublic)
 def get_current_user_info(current_user: UserPublic = Depends(get_current_user)):
     """Get current user information"""
@@ -120,7 +187,7 @@ def bootstrap_first_admin(payload: dict, session: Session = Depends(get_session)
     if not email or not nombre or not password:
         raise HTTPException(status_code=400, detail="email, nombre y password son obligatorios")
 
-    hashed = pwd_context.hash(password)
+    hashed = hash_password_blocking(password)
     user = User(email=email, nombre=nombre, role=RoleEnum.ADMINISTRADOR, password_hash=hashed, employee_id=None)
     session.add(user)
     session.commit()
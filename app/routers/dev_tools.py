@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
-from passlib.context import CryptContext
 
 from app.config import get_settings
 from app.db import get_session
 from app.models.user import User  # must exist from your JWT setup
+from app.security.deps import invalidate_principal
+from app.security.passwords import hash_password_blocking
 
 router = APIRouter(prefix="/dev", tags=["dev"])
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def ensure_dev():
     settings = get_settings()
@@ -34,7 +34,9 @@ def reset_password(payload: dict, _: bool = Depends(ensure_dev), session: Sessio
     if not user:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
 
-    user.password_hash = pwd_context.hash(new_password)
+    user.password_hash = hash_password_blocking(new_password)
+    user.token_version += 1
     session.add(user)
     session.commit()
+    invalidate_principal(user.id)
     return {"ok": True}
\ No newline at end of file
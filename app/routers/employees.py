@@ -1,14 +1,20 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.employee import Employee, EmployeeCreate, EmployeeRead, EmployeeUpdate
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.response_cache import response_cache
+from app.serialization import json_response, employee_json
 from app.security.deps import get_current_user, require_roles
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
+EMPLOYEE_KEYSET = (Employee.id,)
+
 
 @router.post("/", response_model=EmployeeRead, status_code=201)
 def create_employee(
@@ -19,7 +25,9 @@ def create_employee(
     db_employee = Employee.model_validate(employee)
     session.add(db_employee)
     try:
+        bump_version(session, Employee)
         session.commit()
+        response_cache.invalidate(Employee)
         session.refresh(db_employee)
         return db_employee
     except IntegrityError:
@@ -27,25 +35,43 @@ def create_employee(
         raise HTTPException(status_code=409, detail="El correo ya está registrado")
 
 
-@router.get("/", response_model=List[EmployeeRead])
+@router.get("/", response_model=Page[EmployeeRead])
 def list_employees(
-    session: Session = Depends(get_session),
-    current_user = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
+    current_user = Depends(get_current_user),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
 ):
-    employees = session.exec(select(Employee)).all()
-    return employees
+    version = current_version(session, Employee)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Employee, version, request)
+    if body is None:
+        query = keyset(select(Employee), EMPLOYEE_KEYSET, cursor, limit)
+        employees = session.exec(query).all()
+        page = build_page(employees, EMPLOYEE_KEYSET, limit)
+        body = response_cache.put(Employee, version, request, employee_json.page, page)
+    return json_response(body, response)
 
 
 @router.get("/{employee_id}", response_model=EmployeeRead)
 def get_employee(
     employee_id: int, 
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
     current_user = Depends(get_current_user)
 ):
+    cached = not_modified(request, response, current_version(session, Employee))
+    if cached is not None:
+        return cached
     employee = session.get(Employee, employee_id)
     if not employee:
         raise HTTPException(status_code=404, detail="Empleado no encontrado")
-    return employee
+    return json_response(employee_json.one(employee), response)
 
 
 @router.patch("/{employee_id}", response_model=EmployeeRead)
@@ -65,7 +91,9 @@ def update_employee(
     
     session.add(employee)
     try:
+        bump_version(session, Employee)
         session.commit()
+        response_cache.invalidate(Employee)
         session.refresh(employee)
         return employee
     except IntegrityError:
@@ -84,5 +112,7 @@ def delete_employee(
         raise HTTPException(status_code=404, detail="Empleado no encontrado")
     
     session.delete(employee)
+    bump_version(session, Employee)
     session.commit()
+    response_cache.invalidate(Employee)
     return {"message": "Empleado eliminado exitosamente"}
\ No newline at end of file
@@ -0,0 +1,41 @@
+from datetime import date
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Response
+from sqlmodel import Session
+
+from app.db import get_read_session
+from app.models.report import WorkloadPeriod, WorkloadReport
+from app.services.schedule_export import MEDIA_TYPES
+from app.services.workload import render_csv, workload_report
+from app.security.deps import require_roles
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+def workload_response(report: WorkloadReport, fmt: str):
+    if fmt == "csv":
+        return Response(
+            content=render_csv(report),
+            media_type=MEDIA_TYPES["csv"],
+            headers={"Content-Disposition": 'attachment; filename="carga_trabajo.csv"'}
+        )
+    # Serialized here: the report is already validated and can hold thousands of rows
+    return Response(content=report.model_dump_json(), media_type="application/json")
+
+
+@router.get("/workload", response_model=WorkloadReport)
+def get_workload(
+    session: Session = Depends(get_read_session),
+    current_user = Depends(require_roles("Encargado", "Administrador")),
+    fecha_from: date = Query(..., alias="from"),
+    fecha_to: date = Query(..., alias="to"),
+    period: WorkloadPeriod = Query(WorkloadPeriod.week),
+    empleado_id: Optional[int] = Query(None),
+    fmt: Literal["json", "csv"] = Query("json", alias="format")
+):
+    """Shifts and hours per employee and week/month, split by turno
+    
+    Hours per turno come from GADI_SHIFT_HOURS.
+    """
+    report = workload_report(session, fecha_from, fecha_to, period, empleado_id)
+    return workload_response(report, fmt)
@@ -1,15 +1,50 @@
 from datetime import date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
-from app.db import get_session
-from app.models.schedule import Schedule, ScheduleCreate, ScheduleRead, ScheduleUpdate
+from app.db import get_read_session, get_session, read_engine_for
+from app.models.schedule import (
+    RosterRequest, RosterResult, Schedule, ScheduleBulkCreate, ScheduleBulkResult, ScheduleCreate,
+    ScheduleRead, ScheduleSummary, ScheduleUpdate, SummaryGroup
+)
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.serialization import json_response, schedule_json
+from app.services.roster import generate_roster
+from app.services.schedule_bulk import bulk_create
+from app.services.schedule_conflicts import check_conflicts, conflict_index
+from app.services.schedule_export import (
+    EXPORT_BATCH_SIZE, EXPORT_COLUMNS, MEDIA_TYPES, csv_header, render_batch
+)
+from app.services.schedule_summary import apply_summary, summarize
 from app.security.deps import get_current_user, require_roles
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
+SCHEDULE_KEYSET = (Schedule.fecha, Schedule.id)
+
+
+def filter_schedules(
+    query,
+    empleado_id: Optional[int] = None,
+    fecha_from: Optional[date] = None,
+    fecha_to: Optional[date] = None
+):
+    """Apply the empleado/fecha filters shared by the schedule list endpoints"""
+    if empleado_id is not None:
+        query = query.where(Schedule.empleado_id == empleado_id)
+    
+    if fecha_from is not None:
+        query = query.where(Schedule.fecha >= fecha_from)
+    
+    if fecha_to is not None:
+        query = query.where(Schedule.fecha <= fecha_to)
+    
+    return query
+
 
 @router.post("/", response_model=ScheduleRead, status_code=201)
 def create_schedule(
@@ -18,49 +53,132 @@ def create_schedule(
     current_user = Depends(require_roles("Encargado", "Administrador"))
 ):
     db_schedule = Schedule.model_validate(schedule)
+    check_conflicts(session, db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)
     session.add(db_schedule)
     try:
+        apply_summary(session, added=[(db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)])
+        bump_version(session, Schedule)
         session.commit()
         session.refresh(db_schedule)
+        conflict_index.add(db_schedule.id, db_schedule.empleado_id, db_schedule.fecha, db_schedule.turno)
         return db_schedule
     except IntegrityError:
         session.rollback()
         raise HTTPException(status_code=400, detail="Error al crear el horario")
 
 
-@router.get("/", response_model=List[ScheduleRead])
-def list_schedules(
+@router.post("/bulk", response_model=ScheduleBulkResult, status_code=201)
+def create_schedules_bulk(
+    payload: ScheduleBulkCreate,
+    session: Session = Depends(get_session),
+    current_user = Depends(require_roles("Encargado", "Administrador"))
+):
+    """Create many schedules in one transaction with a single batched insert
+    
+    The whole batch is rejected with per-item errors unless partial=true, in which
+    case the valid items are inserted and the invalid ones are reported.
+    """
+    return bulk_create(session, payload)
+
+
+@router.post("/generate", response_model=RosterResult, status_code=201)
+def generate_schedules(
+    request: RosterRequest,
     session: Session = Depends(get_session),
+    current_user = Depends(require_roles("Encargado", "Administrador"))
+):
+    """Generate a roster for a date range and write it with one batched insert
+    
+    Fills the coverage requested per turno each day, respecting existing schedules,
+    max_shifts_per_week and no mañana right after a noche. dry_run=true returns the
+    plan without writing it.
+    """
+    return generate_roster(session, request)
+
+
+@router.get("/", response_model=Page[ScheduleRead])
+def list_schedules(
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
     current_user = Depends(get_current_user),
     empleado_id: Optional[int] = Query(None),
     fecha_from: Optional[date] = Query(None),
-    fecha_to: Optional[date] = Query(None)
+    fecha_to: Optional[date] = Query(None),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
 ):
-    query = select(Schedule)
-    
-    if empleado_id is not None:
-        query = query.where(Schedule.empleado_id == empleado_id)
-    
-    if fecha_from is not None:
-        query = query.where(Schedule.fecha >= fecha_from)
+    cached = not_modified(request, response, current_version(session, Schedule))
+    if cached is not None:
+        return cached
+    query = filter_schedules(select(Schedule), empleado_id, fecha_from, fecha_to)
+    query = keyset(query, SCHEDULE_KEYSET, cursor, limit)
+    schedules = session.exec(query).all()
+    return json_response(schedule_json.page(build_page(schedules, SCHEDULE_KEYSET, limit)), response)
+
+
+@router.get("/export")
+def export_schedules(
+    request: Request,
+    current_user = Depends(get_current_user),
+    empleado_id: Optional[int] = Query(None),
+    fecha_from: Optional[date] = Query(None),
+    fecha_to: Optional[date] = Query(None),
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format")
+):
+    """Stream schedules as NDJSON or CSV, one batch of rows at a time"""
+    query = filter_schedules(select(*EXPORT_COLUMNS), empleado_id, fecha_from, fecha_to)
+    query = query.order_by(*SCHEDULE_KEYSET).execution_options(
+        stream_results=True, yield_per=EXPORT_BATCH_SIZE
+    )
     
-    if fecha_to is not None:
-        query = query.where(Schedule.fecha <= fecha_to)
+    def generate():
+        # The request session is closed before the body streams, so use our own
+        with Session(read_engine_for(request)) as session:
+            if fmt == "csv":
+                yield csv_header()
+            for rows in session.execute(query).partitions():
+                yield render_batch(rows, fmt)
     
-    schedules = session.exec(query).all()
-    return schedules
+    return StreamingResponse(
+        generate(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="horarios.{fmt}"'}
+    )
+
+
+@router.get("/summary", response_model=ScheduleSummary)
+def schedule_summary(
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
+    current_user = Depends(get_current_user),
+    fecha_from: date = Query(..., alias="from"),
+    fecha_to: date = Query(..., alias="to"),
+    group: SummaryGroup = Query(SummaryGroup.day)
+):
+    """Schedules per turno for each day, week or employee in the range, from the aggregate tables"""
+    cached = not_modified(request, response, current_version(session, Schedule))
+    if cached is not None:
+        return cached
+    return summarize(session, fecha_from, fecha_to, group)
 
 
 @router.get("/{schedule_id}", response_model=ScheduleRead)
 def get_schedule(
     schedule_id: int, 
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
     current_user = Depends(get_current_user)
 ):
+    cached = not_modified(request, response, current_version(session, Schedule))
+    if cached is not None:
+        return cached
     schedule = session.get(Schedule, schedule_id)
     if not schedule:
         raise HTTPException(status_code=404, detail="Horario no encontrado")
-    return schedule
+    return json_response(schedule_json.one(schedule), response)
 
 
 @router.patch("/{schedule_id}", response_model=ScheduleRead)
@@ -74,14 +192,24 @@ def update_schedule(
     if not schedule:
         raise HTTPException(status_code=404, detail="Horario no encontrado")
     
+    previous = (schedule.empleado_id, schedule.fecha, schedule.turno)
     schedule_data = schedule_update.model_dump(exclude_unset=True)
     for field, value in schedule_data.items():
         setattr(schedule, field, value)
     
+    check_conflicts(session, schedule.empleado_id, schedule.fecha, schedule.turno, ignore_id=schedule.id)
     session.add(schedule)
     try:
+        apply_summary(
+            session,
+            added=[(schedule.empleado_id, schedule.fecha, schedule.turno)],
+            removed=[previous]
+        )
+        bump_version(session, Schedule)
         session.commit()
         session.refresh(schedule)
+        conflict_index.remove(schedule.id, *previous)
+        conflict_index.add(schedule.id, schedule.empleado_id, schedule.fecha, schedule.turno)
         return schedule
     except IntegrityError:
         session.rollback()
@@ -98,6 +226,10 @@ def delete_schedule(
     if not schedule:
         raise HTTPException(status_code=404, detail="Horario no encontrado")
     
+    slot = (schedule.id, schedule.empleado_id, schedule.fecha, schedule.turno)
     session.delete(schedule)
+    apply_summary(session, removed=[slot[1:]])
+    bump_version(session, Schedule)
     session.commit()
+    conflict_index.remove(*slot)
     return {"message": "Horario eliminado exitosamente"}
\ No newline at end of file
@@ -1,29 +1,62 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.task import Task, TaskCreate, TaskRead, TaskUpdate
+from app.etag import bump_version, current_version, not_modified
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.response_cache import response_cache
+from app.serialization import json_response, task_json
 from app.security.deps import require_roles
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+TASK_KEYSET = (Task.id,)
 
-@router.get("/", response_model=List[TaskRead])
-def list_tasks(session: Session = Depends(get_session)):
-    """List all tasks"""
-    tasks = session.exec(select(Task)).all()
-    return tasks
+
+@router.get("/", response_model=Page[TaskRead])
+def list_tasks(
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
+):
+    """List tasks ordered by id, one page at a time"""
+    version = current_version(session, Task)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Task, version, request)
+    if body is None:
+        query = keyset(select(Task), TASK_KEYSET, cursor, limit)
+        tasks = session.exec(query).all()
+        page = build_page(tasks, TASK_KEYSET, limit)
+        body = response_cache.put(Task, version, request, task_json.page, page)
+    return json_response(body, response)
 
 
 @router.get("/{task_id}", response_model=TaskRead)
-def get_task(task_id: int, session: Session = Depends(get_session)):
+def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    session: Session = Depends(get_read_session)
+):
     """Get a specific task by ID"""
-    task = session.get(Task, task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="Tarea no encontrada")
-    return task
+    version = current_version(session, Task)
+    cached = not_modified(request, response, version)
+    if cached is not None:
+        return cached
+    body = response_cache.get(Task, version, request)
+    if body is None:
+        task = session.get(Task, task_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Tarea no encontrada")
+        body = response_cache.put(Task, version, request, task_json.one, task)
+    return json_response(body, response)
 
 
 @router.post("/", response_model=TaskRead, status_code=201)
@@ -36,7 +69,9 @@ def create_task(
     db_task = Task.model_validate(task)
     session.add(db_task)
     try:
+        bump_version(session, Task)
         session.commit()
+        response_cache.invalidate(Task)
         session.refresh(db_task)
         return db_task
     except IntegrityError:
@@ -62,7 +97,9 @@ def update_task(
     
     session.add(task)
     try:
+        bump_version(session, Task)
         session.commit()
+        response_cache.invalidate(Task)
         session.refresh(task)
         return task
     except IntegrityError:
@@ -82,5 +119,7 @@ def delete_task(
         raise HTTPException(status_code=404, detail="Tarea no encontrada")
     
     session.delete(task)
+    bump_version(session, Task)
     session.commit()
+    response_cache.invalidate(Task)
     return {"message": "Tarea eliminada exitosamente"}
\ No newline at end of file
@@ -1,41 +1,36 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, select
-from passlib.context import CryptContext
 
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.user import User, UserCreate, UserRead, UserUpdate
-from app.security.deps import get_current_user, require_roles
+from app.pagination import DEFAULT_LIMIT, MAX_LIMIT, Page, build_page, keyset
+from app.security.deps import get_current_user, invalidate_principal, require_roles
+from app.security.passwords import hash_password_blocking
+from app.serialization import json_response, user_json
 
 router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+USER_KEYSET = (User.id,)
 
 
-@router.get("/", response_model=List[UserRead])
+@router.get("/", response_model=Page[UserRead])
 def list_users(
-    session: Session = Depends(get_session),
-    current_user = Depends(require_roles("Administrador"))
+    session: Session = Depends(get_read_session),
+    current_user = Depends(require_roles("Administrador")),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = Query(None)
 ):
-    """List all users (Admin only)"""
-    users = session.exec(select(User)).all()
-    return [
-        UserRead(
-            id=user.id or 0,
-            email=user.email,
-            nombre=user.nombre,
-            role=user.role,
-            employee_id=user.employee_id
-        )
-        for user in users
-    ]
+    """List users ordered by id, one page at a time (Admin only)"""
+    query = keyset(select(User), USER_KEYSET, cursor, limit)
+    users = session.exec(query).all()
+    return json_response(user_json.page(build_page(users, USER_KEYSET, limit)))
 
 
 @router.get("/{user_id}", response_model=UserRead)
 def get_user(
     user_id: int,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
     current_user = Depends(require_roles("Administrador"))
 ):
     """Get user by ID (Admin only)"""
@@ -46,13 +41,7 @@ def get_user(
             detail="Usuario no encontrado"
         )
     
-    return UserRead(
-        id=user.id or 0,
-        email=user.email,
-        nombre=user.nombre,
-        role=user.role,
-        employee_id=user.employee_id
-    )
+    return json_response(user_json.one(user))
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
@@ -74,7 +63,7 @@ def create_user(
         )
     
     # Hash password
-    hashed_password = pwd_context.hash(user_data.password)
+    hashed_password = hash_password_blocking(user_data.password)
     
     # Create user
     db_user = User(
@@ -89,13 +78,7 @@ def create_user(
     session.commit()
     session.refresh(db_user)
     
-    return UserRead(
-        id=db_user.id or 0,
-        email=db_user.email,
-        nombre=db_user.nombre,
-        role=db_user.role,
-        employee_id=db_user.employee_id
-    )
+    return json_response(user_json.one(db_user), status_code=status.HTTP_201_CREATED)
 
 
 @router.patch("/{user_id}", response_model=UserRead)
@@ -126,19 +109,17 @@ def update_user(
     
     # Hash new password if provided
     if user_update.password is not None:
-        user.password_hash = pwd_context.hash(user_update.password)
+        user.password_hash = hash_password_blocking(user_update.password)
+    
+    # Revoke tokens that embed the old role/nombre/employee_id
+    user.token_version += 1
     
     session.add(user)
     session.commit()
     session.refresh(user)
+    invalidate_principal(user_id)
     
-    return UserRead(
-        id=user.id or 0,
-        email=user.email,
-        nombre=user.nombre,
-        role=user.role,
-        employee_id=user.employee_id
-    )
+    return json_response(user_json.one(user))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -157,5 +138,6 @@ def delete_user(
     
     session.delete(user)
     session.commit()
+    invalidate_principal(user_id)
     
     return None
\ No newline at end of file
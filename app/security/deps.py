@@ -1,72 +1,177 @@
+from typing import Any, Dict, Optional, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel import Session, select
-from app.db import get_session
+from app.cache import TTLCache
+from app.config import get_settings
+from app.db import get_session, get_async_session
+from app.models.employee import RoleEnum
 from app.models.user import User, UserPublic
 from app.security.jwt import decode_token
 
 security = HTTPBearer(auto_error=False)
 
+settings = get_settings()
+# UserPublic by user id; writers call invalidate_principal so changes apply immediately
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: Session = Depends(get_session)
-) -> UserPublic:
-    """Get current user from JWT token"""
+
+# token_version by user id for tokens with embedded claims; DELETED_USER marks a missing user
+token_versions = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.TOKEN_VERSION_TTL_SECONDS
+)
+DELETED_USER = -1
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Forget everything cached about a user after it changes"""
+    principal_cache.invalidate(user_id)
+    token_versions.invalidate(user_id)
+
+
+def access_token_claims(user: User) -> Dict[str, Any]:
+    """Claims for a new access token; self-contained when JWT_EMBED_CLAIMS is on"""
+    claims: Dict[str, Any] = {"sub": str(user.id)}
+    if settings.JWT_EMBED_CLAIMS:
+        claims.update(
+            email=user.email,
+            nombre=user.nombre,
+            role=user.role.value,
+            employee_id=user.employee_id,
+            tv=user.token_version,
+        )
+    return claims
+
+
+def _unauthorized() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="No autenticado",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _claims_from_credentials(credentials: HTTPAuthorizationCredentials) -> Tuple[int, Dict[str, Any]]:
+    """Extract the user id and payload from the bearer token or raise 401"""
     # Check if credentials are provided
     if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="No autenticado",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
+        raise _unauthorized()
+
     try:
         # Decode the JWT token
         payload = decode_token(credentials.credentials)
         user_id_str = payload.get("sub")
-        
-        if user_id_str is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="No autenticado",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
+
+        if user_id_str is None or payload.get("type") == "refresh":
+            raise _unauthorized()
+
         try:
-            user_id = int(user_id_str)
+            return int(user_id_str), payload
         except (ValueError, TypeError):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="No autenticado",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        # Get user from database
-        user = session.get(User, user_id)
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="No autenticado",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        return UserPublic(
-            id=user.id or 0,  # Handle None case
-            email=user.email,
-            nombre=user.nombre,
-            role=user.role,
-            employee_id=user.employee_id
-        )
-    
+            raise _unauthorized()
+
     except HTTPException:
         raise
     except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="No autenticado",
-            headers={"WWW-Authenticate": "Bearer"},
+        raise _unauthorized()
+
+
+def _to_public(user: User) -> UserPublic:
+    # Built from a validated row, so skip validating it again
+    return UserPublic.model_construct(
+        id=user.id or 0,  # Handle None case
+        email=user.email,
+        nombre=user.nombre,
+        role=user.role,
+        employee_id=user.employee_id
+    )
+
+
+def _principal_from_claims(user_id: int, payload: Dict[str, Any]) -> Optional[UserPublic]:
+    """UserPublic built from the token alone, or None for tokens without embedded claims"""
+    if "tv" not in payload:
+        return None
+    try:
+        # Signed claims we issued ourselves; only the role needs converting back
+        return UserPublic.model_construct(
+            id=user_id,
+            email=payload["email"],
+            nombre=payload["nombre"],
+            role=RoleEnum(payload["role"]),
+            employee_id=payload.get("employee_id")
         )
+    except (KeyError, ValueError):
+        raise _unauthorized()
+
+
+def _check_token_version(payload: Dict[str, Any], version: int) -> None:
+    if version == DELETED_USER or payload["tv"] != version:
+        raise _unauthorized()
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: Session = Depends(get_session)
+) -> UserPublic:
+    """Get current user from JWT token"""
+    user_id, payload = _claims_from_credentials(credentials)
+    
+    principal = _principal_from_claims(user_id, payload)
+    if principal is not None:
+        version = token_versions.get(user_id)
+        if version is None:
+            version = session.exec(select(User.token_version).where(User.id == user_id)).first()
+            version = DELETED_USER if version is None else version
+            token_versions.set(user_id, version)
+        _check_token_version(payload, version)
+        return principal
+    
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    # Get user from database
+    user = session.get(User, user_id)
+    if user is None:
+        raise _unauthorized()
+
+    principal = _to_public(user)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session = Depends(get_async_session)
+) -> UserPublic:
+    """Get current user from JWT token using the async engine"""
+    user_id, payload = _claims_from_credentials(credentials)
+    
+    principal = _principal_from_claims(user_id, payload)
+    if principal is not None:
+        version = token_versions.get(user_id)
+        if version is None:
+            version = (await session.exec(select(User.token_version).where(User.id == user_id))).first()
+            version = DELETED_USER if version is None else version
+            token_versions.set(user_id, version)
+        _check_token_version(payload, version)
+        return principal
+    
+    cached = principal_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    user = await session.get(User, user_id)
+    if user is None:
+        raise _unauthorized()
+
+    principal = _to_public(user)
+    principal_cache.set(user_id, principal)
+    return principal
 
 
 def require_roles(*roles: str):
@@ -75,4 +180,13 @@ def require_roles(*roles: str):
         if current_user.role.value not in roles:  # Use .value for enum
             raise HTTPException(status_code=403, detail="Permiso denegado")
         return current_user
-    return check_roles
\ No newline at end of file
+    return check_roles
+
+
+def require_roles_async(*roles: str):
+    """Dependency factory to require specific roles on async routers"""
+    async def check_roles(current_user: UserPublic = Depends(get_current_user_async)):
+        if current_user.role.value not in roles:  # Use .value for enum
+            raise HTTPException(status_code=403, detail="Permiso denegado")
+        return current_user
+    return check_roles
@@ -1,13 +1,33 @@
+import hashlib
+import secrets
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
 from fastapi import HTTPException
+from app.cache import TTLCache
 from app.config import get_settings
 
 settings = get_settings()
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 
+# Payloads of tokens that already passed signature and claim checks, keyed by
+# a digest of the token and dropped at the token's own exp
+token_cache = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    enabled=settings.TOKEN_CACHE_ENABLED
+)
+
+
+@lru_cache(maxsize=None)
+def _jose():
+    """python-jose loads cryptography (~30 ms per worker), so defer it to the first token"""
+    from jose import JWTError, jwt
+
+    return jwt, JWTError
+
 
 def create_access_token(data: Dict[str, Any], expires_minutes: Optional[int] = None) -> str:
     """Create a JWT access token with the given data"""
@@ -19,15 +39,41 @@ def create_access_token(data: Dict[str, Any], expires_minutes: Optional[int] = N
         expire = datetime.utcnow() + timedelta(minutes=60)  # Default 1 hour
     
     to_encode.update({"exp": expire})
+    jwt, _ = _jose()
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def create_refresh_token(user_id: int, token_version: int) -> str:
+    """Create a long-lived refresh token; its jti is what gets revoked on use or logout"""
+    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {
+        "sub": str(user_id),
+        "type": "refresh",
+        "jti": secrets.token_urlsafe(16),
+        "tv": token_version,
+        "exp": expire,
+    }
+    jwt, _ = _jose()
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
 def decode_token(token: str) -> Dict[str, Any]:
-    """Decode and verify a JWT token"""
+    """Decode and verify a JWT token, reusing earlier verifications of the same token"""
+    key = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+    
+    jwt, JWTError = _jose()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            remaining = exp - time.time()
+            if remaining > 0:
+                token_cache.set(key, payload, ttl=remaining)
+        return dict(payload)
     except JWTError:
         raise HTTPException(
             status_code=401,
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+
+
+@lru_cache(maxsize=None)
+def password_context():
+    """The one passlib context of the process, built on first use so importing the app stays cheap"""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordPool:
+    """Small dedicated pool for bcrypt work with a hard bound on queued jobs
+
+    bcrypt releases the GIL, so a few threads use real cores without touching
+    Starlette's threadpool. Once max_pending jobs are queued or running, new
+    requests are refused with 503 + Retry-After instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_pending: int, retry_after: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self.rejected = 0
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt"
+                )
+            return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Servicio de autenticación saturado, reintente en unos segundos",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def run_blocking(self, fn, *args):
+        return self.submit(fn, *args).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+@lru_cache(maxsize=None)
+def password_pool() -> PasswordPool:
+    """The process-wide pool, built on first use so importing this module reads no settings"""
+    settings = get_settings()
+    return PasswordPool(
+        workers=settings.PASSWORD_POOL_WORKERS,
+        max_pending=settings.PASSWORD_POOL_MAX_PENDING,
+        retry_after=settings.PASSWORD_POOL_RETRY_AFTER,
+    )
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash on the password pool"""
+    return await password_pool().run(password_context().verify, plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password on the password pool"""
+    return await password_pool().run(password_context().hash, password)
+
+
+def hash_password_blocking(password: str) -> str:
+    """Hash a password on the password pool from a sync (threadpool) handler"""
+    return password_pool().run_blocking(password_context().hash, password)
@@ -0,0 +1,147 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.models.token import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings; no false negatives, tunable false positives"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str) -> None:
+        if item in self:
+            return
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationStore:
+    """Revoked refresh token ids: the revoked_token table fronted by a Bloom filter
+
+    A miss in the filter answers "not revoked" without touching the database; a
+    hit is confirmed against the table. The filter pulls rows written by other
+    workers every sync_seconds, and revoke() inserts with a unique jti, so a
+    token is never accepted twice even while the filter lags behind.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, sync_seconds: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.lookups = 0
+        self.table_checks = 0
+        self._filter: Optional[BloomFilter] = None
+        self._last_id = 0
+        self._synced_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def _rebuild(self, session: Session) -> None:
+        """Drop rows for tokens that have expired anyway, then load the rest into a new filter
+
+        The filter gets room for twice the live rows, so growing past capacity costs
+        one rebuild per doubling rather than one per lookup.
+        """
+        session.exec(delete(RevokedToken).where(RevokedToken.expires_at < datetime.utcnow()))
+        session.commit()
+        rows = session.exec(select(RevokedToken.id, RevokedToken.jti).order_by(RevokedToken.id)).all()
+        bloom = BloomFilter(max(self.capacity, 2 * len(rows)), self.error_rate)
+        for _, jti in rows:
+            bloom.add(jti)
+        self._filter = bloom
+        self._last_id = rows[-1][0] if rows else 0
+
+    def _sync(self, session: Session) -> None:
+        now = time.monotonic()
+        if now - self._synced_at <= self.sync_seconds:
+            return
+
+        with self._lock:
+            if now - self._synced_at <= self.sync_seconds:
+                return  # Another thread synced while we waited for the lock
+            if self._filter is None:
+                self._rebuild(session)
+            else:
+                rows = session.exec(
+                    select(RevokedToken.id, RevokedToken.jti)
+                    .where(RevokedToken.id > self._last_id)
+                    .order_by(RevokedToken.id)
+                ).all()
+                for row_id, jti in rows:
+                    self._filter.add(jti)
+                    self._last_id = row_id
+                if self._filter.count > self._filter.capacity:
+                    logger.warning(
+                        "Filtro de revocaciones lleno (%d de %d): se reconstruye",
+                        self._filter.count, self._filter.capacity
+                    )
+                    self._rebuild(session)
+            self._synced_at = now
+
+    def is_revoked(self, session: Session, jti: str) -> bool:
+        self._sync(session)
+        self.lookups += 1
+        bloom = self._filter
+        if bloom is not None and jti not in bloom:
+            return False
+        self.table_checks += 1
+        return session.exec(select(RevokedToken.id).where(RevokedToken.jti == jti)).first() is not None
+
+    def revoke(self, session: Session, jti: str, user_id: int, expires_at: datetime) -> bool:
+        """Record the revocation; False when the token was already revoked"""
+        session.add(RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+            return False
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+        return True
+
+    def stats(self) -> dict:
+        bloom = self._filter
+        return {
+            "size": bloom.count if bloom is not None else 0,
+            "capacity": bloom.capacity if bloom is not None else self.capacity,
+            "bits": bloom.size if bloom is not None else 0,
+            "lookups": self.lookups,
+            "table_checks": self.table_checks,
+        }
+
+
+settings = get_settings()
+revocation_store = RevocationStore(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    sync_seconds=settings.REVOCATION_SYNC_SECONDS
+)
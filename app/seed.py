@@ -1,13 +1,22 @@
+import argparse
+import time
 from datetime import date, timedelta
+from typing import List
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert
 from sqlmodel import Session, select
-from passlib.context import CryptContext
+from app.etag import bump_version
+from app.response_cache import response_cache
 from app.models.employee import Employee, RoleEnum
 from app.models.schedule import Schedule, TurnoEnum
 from app.models.task import Task
+from app.models.seed import SyntheticSeed
 from app.models.user import User
-
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.security.deps import principal_cache, token_versions
+from app.security.passwords import hash_password_blocking
+from app.services.schedule_conflicts import conflict_index
+from app.services.schedule_summary import rebuild_summary
 
 
 def seed_all(session: Session):
@@ -27,6 +36,7 @@ def seed_all(session: Session):
     for task in existing_tasks:
         session.delete(task)
     
+    bump_version(session, Schedule, Employee, Task)
     session.commit()
     
     # Create employees with realistic Spanish names
@@ -115,7 +125,7 @@ def seed_all(session: Session):
             continue
             
         # Hash the password and create new user
-        password_hash = pwd_context.hash(user_data["password"])
+        password_hash = hash_password_blocking(user_data["password"])
         
         user = User(
             email=user_data["email"],
@@ -164,11 +174,178 @@ def seed_all(session: Session):
         session.add(schedule)
         created_schedules.append(schedule)
     
+    session.flush()
+    rebuild_summary(session)
+    bump_version(session, Schedule, Employee, Task)
     session.commit()
+    conflict_index.clear()
+    response_cache.invalidate(Employee)
+    response_cache.invalidate(Task)
     
     return {
         "employees": len(created_employees),
         "schedules": len(created_schedules),
         "tasks": len(created_tasks),
         "users": len(created_users)
-    }
\ No newline at end of file
+    }
+
+SYNTHETIC_DOMAIN = "carga.example.com"  # Emails of generated employees and users
+SYNTHETIC_BATCH_SIZE = 50000
+FIRST_NAMES = ["Ana", "Luis", "Carmen", "Diego", "Marta", "Javier", "Lucía", "Pablo", "Elena", "Sergio",
+               "Laura", "Andrés", "Sara", "Raúl", "Paula", "Jorge", "Irene", "Álvaro", "Nuria", "Óscar"]
+LAST_NAMES = ["García", "Martínez", "López", "Torres", "Ruiz", "Sánchez", "Romero", "Navarro", "Gil",
+              "Serrano", "Molina", "Ortega", "Delgado", "Castro", "Ramos", "Vidal", "Herrera", "Iglesias"]
+# Each employee moves one step per week along mañana -> noche -> tarde -> mañana,
+# so a noche is never followed by a mañana the next day
+ROTATION = [TurnoEnum.manana, TurnoEnum.tarde, TurnoEnum.noche]
+
+
+def _insert_returning_ids(session: Session, model, rows: List[dict]) -> List[int]:
+    if not rows:
+        return []
+    statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(session.execute(statement, rows).scalars().all())
+
+
+def _clear_synthetic(session: Session) -> None:
+    session.execute(delete(Schedule))
+    session.execute(delete(Employee))
+    session.execute(delete(Task))
+    session.execute(delete(User).where(User.email.like(f"%@{SYNTHETIC_DOMAIN}")))
+
+
+def _check_seed_unused(session: Session, seed: int) -> None:
+    """Emails derive from the seed, so reusing one without reset would violate their unique constraints"""
+    taken = session.exec(select(Employee.id).where(
+        Employee.email.like(f"empleado{seed}.%@{SYNTHETIC_DOMAIN}")
+    ).limit(1)).first() or session.exec(select(User.id).where(
+        User.email.like(f"usuario{seed}.%@{SYNTHETIC_DOMAIN}")
+    ).limit(1)).first()
+    if taken is not None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Ya existen datos sintéticos con la semilla {seed}: use reset=true u otra semilla"
+        )
+
+
+def seed_synthetic(session: Session, params: SyntheticSeed) -> dict:
+    """Generate a deterministic dataset of any size with batched inserts
+
+    Schedules are planned with NumPy for the whole range at once and written in
+    executemany batches; the password is hashed a single time for every user.
+    """
+    import numpy as np  # Lazy; see Cold Start in replit.md
+
+    started = time.perf_counter()
+    rng = np.random.default_rng(params.seed)
+    start = params.start
+
+    if params.reset:
+        _clear_synthetic(session)
+    else:
+        _check_seed_unused(session, params.seed)
+
+    first = rng.integers(0, len(FIRST_NAMES), params.employees)
+    last = rng.integers(0, len(LAST_NAMES), params.employees)
+    roles = [RoleEnum.ENCARGADO if x < 0.1 else RoleEnum.TRABAJADOR for x in rng.random(params.employees).tolist()]
+    employee_ids = _insert_returning_ids(session, Employee, [
+        {
+            "nombre": f"{FIRST_NAMES[first[i]]} {LAST_NAMES[last[i]]}",
+            "email": f"empleado{params.seed}.{i}@{SYNTHETIC_DOMAIN}",
+            "role": roles[i],
+        }
+        for i in range(params.employees)
+    ])
+
+    task_ids = _insert_returning_ids(session, Task, [
+        {"nombre": f"Tarea {i + 1}", "descripcion": f"Tarea sintética {i + 1}", "activo": True}
+        for i in range(params.tasks)
+    ])
+
+    password_hash = hash_password_blocking(params.password)
+    user_rows = []
+    for i in range(params.users):
+        employee = i < len(employee_ids)
+        user_rows.append({
+            "email": f"usuario{params.seed}.{i}@{SYNTHETIC_DOMAIN}",
+            "nombre": f"Usuario {i + 1}",
+            "role": RoleEnum.ADMINISTRADOR if i == 0 else (roles[i] if employee else RoleEnum.TRABAJADOR),
+            "password_hash": password_hash,
+            "employee_id": employee_ids[i] if employee else None,
+        })
+    if user_rows:
+        session.execute(insert(User), user_rows)
+
+    # (days, employees) plan: who works each day and on which turno
+    works = rng.random((params.days, params.employees)) < params.occupancy
+    offsets = rng.integers(0, len(ROTATION), params.employees)
+    day_index, employee_index = np.nonzero(works)
+    weeks = (day_index + start.weekday()) // 7
+    turno_index = (offsets[employee_index] - weeks) % len(ROTATION)
+    fechas = (np.datetime64(start, "D") + day_index).astype(object)
+    empleado_ids = np.asarray(employee_ids, dtype=np.int64)[employee_index].tolist()
+    if task_ids:
+        schedule_tasks = np.asarray(task_ids, dtype=np.int64)[rng.integers(0, len(task_ids), len(day_index))].tolist()
+    else:
+        schedule_tasks = [None] * len(day_index)
+
+    turnos = [ROTATION[t] for t in turno_index.tolist()]
+    for offset in range(0, len(day_index), SYNTHETIC_BATCH_SIZE):
+        end = offset + SYNTHETIC_BATCH_SIZE
+        # Core insert on the table: skips the ORM bulk path, which costs more than SQLite itself
+        session.execute(insert(Schedule.__table__), [
+            {"fecha": fecha, "turno": turno, "empleado_id": empleado_id, "task_id": task_id}
+            for fecha, turno, empleado_id, task_id in zip(
+                fechas[offset:end], turnos[offset:end], empleado_ids[offset:end], schedule_tasks[offset:end]
+            )
+        ])
+
+    rebuild_summary(session)
+    bump_version(session, Schedule, Employee, Task)
+    session.commit()
+    conflict_index.clear()
+    response_cache.invalidate(Employee)
+    response_cache.invalidate(Task)
+    principal_cache.clear()
+    token_versions.clear()
+
+    return {
+        "employees": len(employee_ids),
+        "schedules": len(day_index),
+        "tasks": len(task_ids),
+        "users": len(user_rows),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Datos de demostración o sintéticos para pruebas de carga")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("demo", help="seed_all: el conjunto pequeño de demostración")
+    synthetic = subcommands.add_parser("synthetic", help="conjunto generado del tamaño indicado")
+    for name, field in SyntheticSeed.model_fields.items():
+        flag = "--" + name.replace("_", "-")
+        if field.annotation is bool:
+            synthetic.add_argument(flag, action=argparse.BooleanOptionalAction, default=field.default)
+        elif name == "start":
+            synthetic.add_argument(flag, type=date.fromisoformat, default=field.default)
+        else:
+            synthetic.add_argument(flag, type=type(field.default), default=field.default)
+    args = vars(parser.parse_args())
+
+    from app.db import engine
+    from app.migrations import upgrade
+
+    upgrade(engine)
+    with Session(engine) as session:
+        if args.pop("command") == "demo":
+            print(seed_all(session))
+        else:
+            try:
+                print(seed_synthetic(session, SyntheticSeed(**args)))
+            except HTTPException as exc:
+                raise SystemExit(exc.detail)
+
+
+if __name__ == "__main__":
+    main()
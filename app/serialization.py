@@ -0,0 +1,74 @@
+import json
+from datetime import date
+from enum import Enum
+from typing import Any, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.models.employee import EmployeeRead
+from app.models.schedule import ScheduleRead
+from app.models.task import TaskRead
+from app.models.user import UserRead
+from app.pagination import Page
+
+try:
+    import orjson
+except ImportError:  # The stdlib encoder below keeps orjson optional
+    orjson = None
+
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+else:
+    FastJSONResponse = JSONResponse
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """JSON bytes with the same output for dates and enums as FastAPI's encoder"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class RowSerializer:
+    """ORM rows straight to JSON bytes using a read schema's field names
+
+    Rows loaded from our own tables already satisfy the schema, so validating them
+    again through response_model only costs CPU. Only the schema's fields are read,
+    which keeps columns such as password_hash out of the output.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.fields = tuple(schema.model_fields)
+
+    def row(self, obj: Any) -> dict:
+        return {field: getattr(obj, field) for field in self.fields}
+
+    def one(self, obj: Any) -> bytes:
+        return dumps(self.row(obj))
+
+    def page(self, page: Page) -> bytes:
+        return dumps({"items": [self.row(obj) for obj in page.items], "next_cursor": page.next_cursor})
+
+
+employee_json = RowSerializer(EmployeeRead)
+schedule_json = RowSerializer(ScheduleRead)
+task_json = RowSerializer(TaskRead)
+user_json = RowSerializer(UserRead)
+
+
+def json_response(body: bytes, response: Optional[Response] = None, status_code: int = 200) -> Response:
+    """Send pre-serialized bytes, keeping the headers (ETag) already set on response"""
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
@@ -0,0 +1,183 @@
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, List, Tuple
+
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from app.etag import bump_version
+from app.models.employee import Employee
+from app.models.schedule import (
+    RosterRequest, RosterResult, RosterShortfall, Schedule, ScheduleCreate, TurnoEnum
+)
+from app.models.task import Task
+from app.services.schedule_bulk import index_rows, insert_batch
+from app.services.schedule_summary import apply_summary
+
+# numpy is imported inside the functions that use it; see Cold Start in replit.md
+if TYPE_CHECKING:
+    import numpy as np
+
+TURNOS = list(TurnoEnum)  # Index order used by every array below
+MANANA = TURNOS.index(TurnoEnum.manana)
+NOCHE = TURNOS.index(TurnoEnum.noche)
+FREE = -1
+MAX_ROSTER_DAYS = 366
+
+
+def plan_roster(
+    start: date,
+    coverage: "np.ndarray",
+    max_per_week: int,
+    occupied: "np.ndarray",
+    night_before: "np.ndarray",
+    week_counts: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Assign shifts day by day, evaluating every constraint for all employees at once
+
+    occupied is a (days + 1, employees) matrix of existing turno indexes (FREE when
+    empty); its last row is the day after the range so a planned noche never lands
+    before an existing mañana. night_before marks a noche on the day before start.
+    week_counts is a (weeks, employees) matrix with every existing shift of each
+    Monday-Sunday week touched by the range, including days outside it, so a week
+    starts from its full existing total before anything is assigned.
+
+    Returns the (days, employees) matrix of newly assigned turno indexes and the
+    (days, turnos) matrix of uncovered positions.
+    """
+    import numpy as np
+
+    n_days = occupied.shape[0] - 1
+    n_employees = occupied.shape[1]
+    assigned = np.full((n_days, n_employees), FREE, dtype=np.int8)
+    shortfall = np.zeros((n_days, len(TURNOS)), dtype=np.int32)
+    load = np.zeros(n_employees, dtype=np.int64)
+    night_before = night_before.copy()
+    positions = np.arange(n_employees)
+    offset = start.weekday()  # Day index d falls in week (d + offset) // 7
+
+    for d in range(n_days):
+        if d == 0 or (d + offset) % 7 == 0:
+            week = week_counts[(d + offset) // 7].astype(np.int64)
+
+        existing = occupied[d]
+        busy = existing != FREE
+        load += busy
+        need = coverage - np.bincount(existing[busy], minlength=len(TURNOS))
+
+        for t in range(len(TURNOS)):
+            k = int(need[t])
+            if k <= 0:
+                continue
+
+            eligible = ~busy & (week < max_per_week)
+            if t == MANANA:
+                eligible &= ~night_before
+            if t == NOCHE:
+                eligible &= occupied[d + 1] != MANANA
+
+            candidates = positions[eligible]
+            if len(candidates) <= k:
+                shortfall[d, t] = k - len(candidates)
+                picked = candidates
+            else:
+                # Least loaded first; ties rotate with the day so the same people don't always win
+                key = load[candidates] * n_employees + (candidates - d) % n_employees
+                picked = candidates[np.argpartition(key, k - 1)[:k]]
+
+            assigned[d, picked] = t
+            busy[picked] = True
+            week[picked] += 1
+            load[picked] += 1
+
+        night_before = (existing == NOCHE) | (assigned[d] == NOCHE)
+
+    return assigned, shortfall
+
+
+def _employee_ids(session: Session, request: RosterRequest) -> List[int]:
+    if request.empleado_ids is None:
+        return list(session.exec(select(Employee.id).order_by(Employee.id)).all())
+
+    ids = sorted(set(request.empleado_ids))
+    found = set(session.exec(select(Employee.id).where(Employee.id.in_(ids))).all())
+    if len(found) != len(ids):
+        raise HTTPException(status_code=400, detail="Empleado no encontrado")
+    return ids
+
+
+def generate_roster(session: Session, request: RosterRequest) -> RosterResult:
+    import numpy as np
+
+    n_days = (request.fecha_to - request.fecha_from).days + 1
+    if n_days < 1 or n_days > MAX_ROSTER_DAYS:
+        raise HTTPException(status_code=400, detail="Rango de fechas inválido")
+    if request.max_shifts_per_week < 0 or any(v < 0 for v in request.coverage.values()):
+        raise HTTPException(status_code=400, detail="Cobertura inválida")
+    if request.task_id is not None and session.get(Task, request.task_id) is None:
+        raise HTTPException(status_code=400, detail="Tarea no encontrada")
+
+    employee_ids = _employee_ids(session, request)
+    column = {employee_id: i for i, employee_id in enumerate(employee_ids)}
+    n_employees = len(employee_ids)
+
+    # Existing shifts from the Monday of the first week through the Sunday of the last
+    # (and the day after the range, which may be the next Monday)
+    start = request.fecha_from
+    end = start + timedelta(days=n_days)
+    week_start = start - timedelta(days=start.weekday())
+    week_end = request.fecha_to + timedelta(days=6 - request.fecha_to.weekday())
+    window_start = min(week_start, start - timedelta(days=1))
+    existing = session.exec(
+        select(Schedule.empleado_id, Schedule.fecha, Schedule.turno)
+        .where(Schedule.fecha >= window_start)
+        .where(Schedule.fecha <= max(week_end, end))
+        .where(Schedule.empleado_id.in_(employee_ids))
+    ).all()
+
+    n_weeks = (week_end - week_start).days // 7 + 1
+    occupied = np.full((n_days + 1, n_employees), FREE, dtype=np.int8)
+    night_before = np.zeros(n_employees, dtype=bool)
+    week_counts = np.zeros((n_weeks, n_employees), dtype=np.int64)
+    for empleado_id, fecha, turno in existing:
+        e = column[empleado_id]
+        t = TURNOS.index(turno)
+        if start <= fecha <= end:
+            occupied[(fecha - start).days, e] = t
+        if fecha == start - timedelta(days=1) and t == NOCHE:
+            night_before[e] = True
+        if week_start <= fecha <= week_end:
+            week_counts[(fecha - week_start).days // 7, e] += 1
+
+    coverage = np.array([request.coverage.get(turno, 0) for turno in TURNOS], dtype=np.int64)
+    assigned, shortfall = plan_roster(
+        start, coverage, request.max_shifts_per_week, occupied, night_before, week_counts
+    )
+
+    days, employees = np.nonzero(assigned != FREE)
+    rows = [
+        {
+            "fecha": start + timedelta(days=int(d)),
+            "turno": TURNOS[assigned[d, e]],
+            "empleado_id": employee_ids[e],
+            "task_id": request.task_id,
+        }
+        for d, e in zip(days.tolist(), employees.tolist())
+    ]
+    shortfalls = [
+        RosterShortfall(fecha=start + timedelta(days=int(d)), turno=TURNOS[t], missing=int(shortfall[d, t]))
+        for d, t in zip(*np.nonzero(shortfall))
+    ]
+
+    if request.dry_run:
+        return RosterResult(
+            created=0,
+            items=[ScheduleCreate(**row) for row in rows],
+            shortfalls=shortfalls
+        )
+
+    ids = insert_batch(session, rows)
+    apply_summary(session, added=[(row["empleado_id"], row["fecha"], row["turno"]) for row in rows])
+    bump_version(session, Schedule)
+    session.commit()
+    index_rows(ids, rows)
+    return RosterResult(created=len(ids), ids=ids, shortfalls=shortfalls)
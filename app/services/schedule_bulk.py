@@ -0,0 +1,93 @@
+from typing import Dict, List, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import insert, tuple_
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.etag import bump_version
+from app.models.employee import Employee
+from app.models.schedule import (
+    Schedule, ScheduleBulkCreate, ScheduleBulkError, ScheduleBulkResult, ScheduleCreate
+)
+from app.models.task import Task
+from app.services.schedule_conflicts import conflict_index
+from app.services.schedule_summary import apply_summary
+
+
+def validate_batch(session: Session, items: Sequence[ScheduleCreate]) -> Dict[int, str]:
+    """Validate a whole batch with one query per referenced table; returns {index: detail}"""
+    settings = get_settings()
+    errors: Dict[int, str] = {}
+    
+    employee_ids = {item.empleado_id for item in items}
+    known_employees = set(session.exec(select(Employee.id).where(Employee.id.in_(employee_ids))).all())
+    
+    task_ids = {item.task_id for item in items if item.task_id is not None}
+    known_tasks = set()
+    if task_ids:
+        known_tasks = set(session.exec(select(Task.id).where(Task.id.in_(task_ids))).all())
+    
+    valid = []
+    for index, item in enumerate(items):
+        if item.empleado_id not in known_employees:
+            errors[index] = "Empleado no encontrado"
+        elif item.task_id is not None and item.task_id not in known_tasks:
+            errors[index] = "Tarea no encontrada"
+        else:
+            valid.append(index)
+    
+    slots = [(items[index].empleado_id, items[index].fecha, items[index].turno) for index in valid]
+    if settings.SCHEDULE_CONFLICT_CHECK:
+        conflict_index.load(session, [(empleado_id, fecha) for empleado_id, fecha, _ in slots])
+        for position, detail in conflict_index.batch_conflicts(slots).items():
+            errors[valid[position]] = detail
+    elif settings.SCHEDULE_UNIQUE_SLOT and slots:
+        taken = set(session.exec(
+            select(Schedule.empleado_id, Schedule.fecha, Schedule.turno)
+            .where(tuple_(Schedule.empleado_id, Schedule.fecha, Schedule.turno).in_(set(slots)))
+        ).all())
+        for index, slot in zip(valid, slots):
+            if slot in taken:
+                errors[index] = "El empleado ya tiene ese turno asignado"
+            taken.add(slot)
+    
+    return errors
+
+
+def insert_batch(session: Session, rows: List[dict]) -> List[int]:
+    """Insert rows with a single executemany and return their ids in input order"""
+    if not rows:
+        return []
+    statement = insert(Schedule).returning(Schedule.id, sort_by_parameter_order=True)
+    return list(session.execute(statement, rows).scalars().all())
+
+
+def index_rows(ids: List[int], rows: List[dict]) -> None:
+    """Record freshly inserted rows in the conflict index"""
+    for schedule_id, row in zip(ids, rows):
+        conflict_index.add(schedule_id, row["empleado_id"], row["fecha"], row["turno"])
+
+
+def bulk_create(session: Session, payload: ScheduleBulkCreate) -> ScheduleBulkResult:
+    errors = validate_batch(session, payload.items)
+    report = [ScheduleBulkError(index=index, detail=detail) for index, detail in sorted(errors.items())]
+    
+    if errors and not payload.partial:
+        raise HTTPException(
+            status_code=422,
+            detail=[error.model_dump() for error in report]
+        )
+    
+    rows = [
+        item.model_dump()
+        for index, item in enumerate(payload.items)
+        if index not in errors
+    ]
+    ids = insert_batch(session, rows)
+    apply_summary(session, added=[(row["empleado_id"], row["fecha"], row["turno"]) for row in rows])
+    bump_version(session, Schedule)
+    session.commit()
+    index_rows(ids, rows)
+    
+    return ScheduleBulkResult(created=len(ids), ids=ids, errors=report)
@@ -0,0 +1,183 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.models.schedule import Schedule, TurnoEnum
+
+Slot = Tuple[date, TurnoEnum]
+
+
+class _Window:
+    """One employee's occupied slots between lo and hi (inclusive)"""
+
+    __slots__ = ("lo", "hi", "loaded_at", "slots")
+
+    def __init__(self, lo: date, hi: date, loaded_at: float):
+        self.lo = lo
+        self.hi = hi
+        self.loaded_at = loaded_at
+        self.slots: Dict[Slot, int] = {}
+
+    def covers(self, lo: date, hi: date) -> bool:
+        return self.lo <= lo and hi <= self.hi
+
+
+class ScheduleConflictIndex:
+    """Per-employee map of occupied (fecha, turno) slots -> schedule id
+
+    Only a date window around the writes is loaded: the dates being written plus
+    window_days on each side, in one query for a whole batch. A write outside an
+    employee's window reloads it, entries are reloaded after ttl seconds (which
+    bounds staleness when several workers write), and the least recently used
+    employees are evicted beyond max_employees. Writes in this process update the
+    index directly.
+
+    The check and the later commit are not atomic. Two concurrent requests, in
+    this worker or another, can both pass the check and book the same slot: only
+    the GADI_SCHEDULE_UNIQUE_SLOT index stops that in the database. A noche
+    followed by a mañana has no database guarantee at all.
+    """
+
+    def __init__(self, ttl: float, window_days: int = 31, max_employees: int = 1024):
+        self.ttl = ttl
+        self.window_days = window_days
+        self.max_employees = max_employees
+        self._windows: "OrderedDict[int, _Window]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def load(self, session: Session, slots: Iterable[Tuple[int, date]]) -> None:
+        """Make sure the (empleado_id, fecha) pairs about to be written are present and fresh"""
+        needed: Dict[int, Tuple[date, date]] = {}
+        for employee_id, fecha in slots:
+            lo, hi = needed.get(employee_id, (fecha, fecha))
+            needed[employee_id] = (min(lo, fecha), max(hi, fecha))
+
+        now = time.monotonic()
+        missing: Dict[int, _Window] = {}
+        with self._lock:
+            for employee_id, (lo, hi) in needed.items():
+                # A slot clashes with the night before and the morning after
+                lo, hi = lo - timedelta(days=1), hi + timedelta(days=1)
+                window = self._windows.get(employee_id)
+                if window is not None and now - window.loaded_at <= self.ttl and window.covers(lo, hi):
+                    self._windows.move_to_end(employee_id)
+                    continue
+                pad = timedelta(days=self.window_days)
+                missing[employee_id] = _Window(lo - pad, hi + pad, now)
+        if not missing:
+            return
+
+        # No autoflush: a PATCH calls this with the moved row still pending, and flushing
+        # it would index the new slot as committed (missing the clash, or keeping it after
+        # a rejected update is rolled back)
+        with session.no_autoflush:
+            rows = session.exec(
+                select(Schedule.id, Schedule.empleado_id, Schedule.fecha, Schedule.turno)
+                .where(Schedule.empleado_id.in_(missing))
+                .where(Schedule.fecha >= min(window.lo for window in missing.values()))
+                .where(Schedule.fecha <= max(window.hi for window in missing.values()))
+            ).all()
+        for schedule_id, empleado_id, fecha, turno in rows:
+            window = missing[empleado_id]
+            if window.lo <= fecha <= window.hi:
+                window.slots[(fecha, turno)] = schedule_id
+
+        with self._lock:
+            for employee_id, window in missing.items():
+                self._windows[employee_id] = window
+                self._windows.move_to_end(employee_id)
+            # Evict the least recently used, but never an employee this call needs
+            while len(self._windows) > self.max_employees:
+                oldest = next(iter(self._windows))
+                if oldest in needed:
+                    break
+                del self._windows[oldest]
+
+    def conflicts(
+        self,
+        empleado_id: int,
+        fecha: date,
+        turno: TurnoEnum,
+        ignore_id: Optional[int] = None
+    ) -> List[int]:
+        """Ids of schedules that clash with the slot: same turno, or noche followed by mañana"""
+        with self._lock:
+            window = self._windows.get(empleado_id)
+            slots = window.slots if window is not None else {}
+            found = [slots.get(slot) for slot in _clashing_slots(fecha, turno)]
+        return [schedule_id for schedule_id in found if schedule_id is not None and schedule_id != ignore_id]
+
+    def batch_conflicts(self, rows: Sequence[Tuple[int, date, TurnoEnum]]) -> Dict[int, str]:
+        """Check a whole batch in one pass against the index and against itself"""
+        errors: Dict[int, str] = {}
+        pending: Dict[int, Dict[Slot, int]] = {}
+        for position, (empleado_id, fecha, turno) in enumerate(rows):
+            existing = self.conflicts(empleado_id, fecha, turno)
+            if existing:
+                errors[position] = f"Conflicto con los horarios {existing}"
+                continue
+            own = pending.setdefault(empleado_id, {})
+            clash = [own[slot] for slot in _clashing_slots(fecha, turno) if slot in own]
+            if clash:
+                errors[position] = f"Conflicto con el elemento {clash[0]} del lote"
+                continue
+            own[(fecha, turno)] = position
+        return errors
+
+    def add(self, schedule_id: int, empleado_id: int, fecha: date, turno: TurnoEnum) -> None:
+        with self._lock:
+            window = self._windows.get(empleado_id)
+            if window is not None and window.lo <= fecha <= window.hi:
+                window.slots[(fecha, turno)] = schedule_id
+
+    def remove(self, schedule_id: int, empleado_id: int, fecha: date, turno: TurnoEnum) -> None:
+        with self._lock:
+            window = self._windows.get(empleado_id)
+            if window is not None and window.slots.get((fecha, turno)) == schedule_id:
+                del window.slots[(fecha, turno)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
+
+
+def _clashing_slots(fecha: date, turno: TurnoEnum) -> List[Slot]:
+    slots = [(fecha, turno)]
+    if turno == TurnoEnum.manana:
+        slots.append((fecha - timedelta(days=1), TurnoEnum.noche))
+    elif turno == TurnoEnum.noche:
+        slots.append((fecha + timedelta(days=1), TurnoEnum.manana))
+    return slots
+
+
+settings = get_settings()
+conflict_index = ScheduleConflictIndex(
+    ttl=settings.SCHEDULE_INDEX_TTL_SECONDS,
+    window_days=settings.SCHEDULE_INDEX_WINDOW_DAYS,
+    max_employees=settings.SCHEDULE_INDEX_MAX_EMPLOYEES
+)
+
+
+def check_conflicts(
+    session: Session,
+    empleado_id: int,
+    fecha: date,
+    turno: TurnoEnum,
+    ignore_id: Optional[int] = None
+) -> None:
+    """Raise 409 with the conflicting schedule ids when the slot clashes"""
+    if not get_settings().SCHEDULE_CONFLICT_CHECK:
+        return
+    conflict_index.load(session, [(empleado_id, fecha)])
+    conflicting = conflict_index.conflicts(empleado_id, fecha, turno, ignore_id)
+    if conflicting:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "El empleado ya tiene un turno incompatible", "schedule_ids": conflicting}
+        )
@@ -0,0 +1,39 @@
+import csv
+import io
+import json
+
+from app.models.schedule import Schedule
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = ("id", "fecha", "turno", "empleado_id", "task_id")
+# Plain columns instead of ORM entities: rows are never added to the identity map
+EXPORT_COLUMNS = tuple(getattr(Schedule, field) for field in EXPORT_FIELDS)
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def csv_header() -> str:
+    return ",".join(EXPORT_FIELDS) + "\r\n"
+
+
+def render_batch(rows, fmt: str) -> str:
+    """Serialize one batch of rows; only a single batch is ever held in memory"""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow((row.id, row.fecha.isoformat(), row.turno.value, row.empleado_id, row.task_id))
+        return buffer.getvalue()
+    
+    return "".join(
+        json.dumps({
+            "id": row.id,
+            "fecha": row.fecha.isoformat(),
+            "turno": row.turno.value,
+            "empleado_id": row.empleado_id,
+            "task_id": row.task_id,
+        }, ensure_ascii=False) + "\n"
+        for row in rows
+    )
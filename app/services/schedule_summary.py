@@ -0,0 +1,186 @@
+"""Aggregate tables behind GET /schedules/summary
+
+Every schedule write passes its added/removed slots to apply_summary() in the
+same transaction. Databases that predate the tables (or were edited by hand)
+are fixed with:
+
+    python -m app.services.schedule_summary rebuild
+"""
+import argparse
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import delete, func, insert, update
+from sqlmodel import Session, select
+
+from app.models.report import WorkloadPeriod
+from app.models.schedule import (
+    Schedule, ScheduleDaySummary, ScheduleEmployeeMonthSummary, ScheduleSummary,
+    ScheduleSummaryItem, SummaryGroup, TurnoEnum
+)
+from app.services.workload import period_column
+
+Slot = Tuple[int, date, TurnoEnum]  # (empleado_id, fecha, turno)
+
+DAY_KEY = ("fecha", "turno")
+EMPLOYEE_MONTH_KEY = ("month", "empleado_id", "turno")
+
+
+def month_start(fecha: date) -> date:
+    return fecha.replace(day=1)
+
+
+def _next_month(fecha: date) -> date:
+    return (fecha.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+def _add_totals(session, model, key: Sequence[str], deltas: Counter) -> None:
+    """total += delta for each key, creating missing rows"""
+    rows = [dict(zip(key, k), total=delta) for k, delta in deltas.items() if delta]
+    if not rows:
+        return
+    table = model.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        statement = upsert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(key),
+            set_={"total": table.c.total + statement.excluded.total}
+        )
+        session.execute(statement, rows)
+        return
+
+    for row in rows:
+        condition = [table.c[name] == row[name] for name in key]
+        result = session.execute(update(table).where(*condition).values(total=table.c.total + row["total"]))
+        if result.rowcount == 0:
+            session.execute(insert(table).values(**row))
+
+
+def apply_summary(session: Session, added: Iterable[Slot] = (), removed: Iterable[Slot] = ()) -> None:
+    """Fold schedule writes into the aggregate tables; call before commit"""
+    days: Counter = Counter()
+    months: Counter = Counter()
+    for sign, slots in ((1, added), (-1, removed)):
+        for empleado_id, fecha, turno in slots:
+            days[(fecha, turno)] += sign
+            months[(month_start(fecha), empleado_id, turno)] += sign
+    _add_totals(session, ScheduleDaySummary, DAY_KEY, days)
+    _add_totals(session, ScheduleEmployeeMonthSummary, EMPLOYEE_MONTH_KEY, months)
+
+
+def rebuild_summary(session) -> int:
+    """Recompute both tables from the schedule table; works on a Session or a Connection"""
+    session.execute(delete(ScheduleDaySummary))
+    session.execute(delete(ScheduleEmployeeMonthSummary))
+
+    session.execute(insert(ScheduleDaySummary).from_select(
+        [*DAY_KEY, "total"],
+        select(Schedule.fecha, Schedule.turno, func.count()).group_by(Schedule.fecha, Schedule.turno)
+    ))
+
+    dialect = session.dialect if hasattr(session, "dialect") else session.get_bind().dialect
+    if dialect.name in ("sqlite", "postgresql"):
+        month = period_column(dialect.name, WorkloadPeriod.month)
+        session.execute(insert(ScheduleEmployeeMonthSummary).from_select(
+            [*EMPLOYEE_MONTH_KEY, "total"],
+            select(month, Schedule.empleado_id, Schedule.turno, func.count())
+            .group_by(month, Schedule.empleado_id, Schedule.turno)
+        ))
+    else:
+        rows = session.execute(
+            select(Schedule.empleado_id, Schedule.fecha, Schedule.turno, func.count())
+            .group_by(Schedule.empleado_id, Schedule.fecha, Schedule.turno)
+        ).all()
+        months: Counter = Counter()
+        for empleado_id, fecha, turno, count in rows:
+            months[(month_start(fecha), empleado_id, turno)] += count
+        if months:
+            session.execute(
+                insert(ScheduleEmployeeMonthSummary),
+                [dict(zip(EMPLOYEE_MONTH_KEY, k), total=v) for k, v in months.items()]
+            )
+
+    return session.execute(select(func.coalesce(func.sum(ScheduleDaySummary.total), 0))).scalar_one()
+
+
+def _items(groups: Dict, field: str) -> List[ScheduleSummaryItem]:
+    items = []
+    for key in sorted(groups):
+        counts = {turno: groups[key].get(turno, 0) for turno in TurnoEnum}
+        items.append(ScheduleSummaryItem(**{field: key}, counts=counts, total=sum(counts.values())))
+    return items
+
+
+def summarize(session: Session, fecha_from: date, fecha_to: date, group: SummaryGroup) -> ScheduleSummary:
+    if fecha_from > fecha_to:
+        raise HTTPException(status_code=400, detail="Rango de fechas inválido")
+
+    groups: Dict = defaultdict(Counter)
+    if group == SummaryGroup.employee:
+        # Whole months come from the monthly table, the partial months at the edges from schedule
+        full_from = fecha_from if fecha_from.day == 1 else _next_month(fecha_from)
+        full_to = month_start(fecha_to + timedelta(days=1))
+        edges = [(fecha_from, fecha_to)]
+        if full_from < full_to:
+            edges = [(fecha_from, full_from - timedelta(days=1)), (full_to, fecha_to)]
+            rows = session.exec(
+                select(ScheduleEmployeeMonthSummary.empleado_id, ScheduleEmployeeMonthSummary.turno,
+                       func.sum(ScheduleEmployeeMonthSummary.total))
+                .where(ScheduleEmployeeMonthSummary.month >= full_from)
+                .where(ScheduleEmployeeMonthSummary.month < full_to)
+                .group_by(ScheduleEmployeeMonthSummary.empleado_id, ScheduleEmployeeMonthSummary.turno)
+            ).all()
+            for empleado_id, turno, total in rows:
+                groups[empleado_id][turno] += total
+        for start, end in edges:
+            if start > end:
+                continue
+            rows = session.exec(
+                select(Schedule.empleado_id, Schedule.turno, func.count())
+                .where(Schedule.fecha >= start)
+                .where(Schedule.fecha <= end)
+                .group_by(Schedule.empleado_id, Schedule.turno)
+            ).all()
+            for empleado_id, turno, total in rows:
+                groups[empleado_id][turno] += total
+        groups = {k: v for k, v in groups.items() if sum(v.values()) > 0}
+        items = _items(groups, "empleado_id")
+    else:
+        rows = session.exec(
+            select(ScheduleDaySummary.fecha, ScheduleDaySummary.turno, ScheduleDaySummary.total)
+            .where(ScheduleDaySummary.fecha >= fecha_from)
+            .where(ScheduleDaySummary.fecha <= fecha_to)
+            .where(ScheduleDaySummary.total > 0)
+        ).all()
+        for fecha, turno, total in rows:
+            if group == SummaryGroup.week:
+                fecha = fecha - timedelta(days=fecha.weekday())
+            groups[fecha][turno] += total
+        items = _items(groups, "fecha")
+
+    return ScheduleSummary(group=group, fecha_from=fecha_from, fecha_to=fecha_to, items=items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mantenimiento del resumen de horarios")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.parse_args()
+
+    from app.db import engine
+    from app.migrations import upgrade
+
+    upgrade(engine)
+    with engine.begin() as connection:
+        total = rebuild_summary(connection)
+    print(f"Resumen reconstruido a partir de {total} horarios")
+
+
+if __name__ == "__main__":
+    main()
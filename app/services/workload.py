@@ -0,0 +1,168 @@
+import csv
+import io
+from datetime import date
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Date, case, cast, func
+from sqlmodel import Session, select
+
+from app.config import get_settings
+from app.models.employee import Employee
+from app.models.report import WorkloadPeriod, WorkloadReport
+from app.models.schedule import Schedule, TurnoEnum
+
+# numpy is imported inside the functions that use it; see Cold Start in replit.md
+if TYPE_CHECKING:
+    import numpy as np
+
+TURNOS = list(TurnoEnum)  # Index order of the last axis of every array below
+DEFAULT_SHIFT_HOURS = 8.0  # For turnos missing from GADI_SHIFT_HOURS
+CSV_FIELDS = (
+    ["empleado_id", "nombre", "periodo"]
+    + [f"turnos_{turno.name}" for turno in TURNOS]
+    + [f"horas_{turno.name}" for turno in TURNOS]
+    + ["total_turnos", "total_horas"]
+)
+
+
+def shift_hours() -> "np.ndarray":
+    import numpy as np
+
+    configured = get_settings().SHIFT_HOURS
+    return np.array([configured.get(turno.value, DEFAULT_SHIFT_HOURS) for turno in TURNOS], dtype=np.float64)
+
+
+def period_starts(days: "np.ndarray", period: WorkloadPeriod) -> "np.ndarray":
+    """First day of the week (Monday) or month of each datetime64[D] value"""
+    import numpy as np
+
+    if period == WorkloadPeriod.month:
+        return days.astype("datetime64[M]").astype("datetime64[D]")
+    # 1970-01-01 was a Thursday, three days after a Monday
+    return days - (days.astype(np.int64) + 3) % 7
+
+
+def period_column(dialect: str, period: WorkloadPeriod):
+    """SQL expression for the period start, so GROUP BY returns one row per cell
+
+    Other dialects group by the day and aggregate_workload buckets the days.
+    """
+    if dialect == "sqlite":
+        modifiers = ("start of month",) if period == WorkloadPeriod.month else ("weekday 0", "-6 days")
+        return func.date(Schedule.fecha, *modifiers)
+    if dialect == "postgresql":
+        return cast(func.date_trunc(period.value, Schedule.fecha), Date)
+    return Schedule.fecha
+
+
+def aggregate_workload(empleado_ids: "np.ndarray", days: "np.ndarray", shifts: "np.ndarray", period: WorkloadPeriod):
+    """Sum shifts per (employee, period) with one bincount per turno over the whole range
+
+    shifts is a (rows, turnos) matrix of shift counts. Returns the employee ids,
+    the period starts and a (employees, periods, turnos) matrix of shift counts.
+    """
+    import numpy as np
+
+    employees, employee_index = np.unique(empleado_ids, return_inverse=True)
+    periods, period_index = np.unique(period_starts(days, period), return_inverse=True)
+    cell = employee_index * len(periods) + period_index
+    counts = np.stack([
+        np.bincount(cell, weights=shifts[:, t], minlength=len(employees) * len(periods))
+        for t in range(len(TURNOS))
+    ], axis=1).astype(np.int64)
+    return employees, periods, counts.reshape(len(employees), len(periods), len(TURNOS))
+
+
+def workload_report(
+    session: Session,
+    fecha_from: date,
+    fecha_to: date,
+    period: WorkloadPeriod,
+    empleado_id: Optional[int] = None
+) -> WorkloadReport:
+    import numpy as np
+
+    if fecha_from > fecha_to:
+        raise HTTPException(status_code=400, detail="Rango de fechas inválido")
+
+    # One row per (employee, period) with a count column per turno
+    periodo = period_column(session.get_bind().dialect.name, period)
+    query = (
+        select(
+            Schedule.empleado_id,
+            periodo,
+            *(func.sum(case((Schedule.turno == turno, 1), else_=0)) for turno in TURNOS)
+        )
+        .where(Schedule.fecha >= fecha_from)
+        .where(Schedule.fecha <= fecha_to)
+        .group_by(Schedule.empleado_id, periodo)
+    )
+    if empleado_id is not None:
+        query = query.where(Schedule.empleado_id == empleado_id)
+    rows = session.execute(query).all()
+
+    hours = shift_hours()
+    report = {
+        "period": period,
+        "fecha_from": fecha_from,
+        "fecha_to": fecha_to,
+        "shift_hours": dict(zip(TURNOS, hours.tolist())),
+        "rows": [],
+    }
+    if not rows:
+        return WorkloadReport.model_validate(report)
+
+    # Columnar copies of the result; everything after this is array arithmetic
+    columns = list(zip(*rows))
+    employees, periods, counts = aggregate_workload(
+        np.array(columns[0], dtype=np.int64),
+        np.array(columns[1], dtype="datetime64[D]"),
+        np.array(columns[2:], dtype=np.int64).T,
+        period
+    )
+    worked = counts * hours
+    total_shifts = counts.sum(axis=2)
+    total_hours = worked.sum(axis=2)
+
+    names = dict(session.exec(
+        select(Employee.id, Employee.nombre).where(Employee.id.in_(employees.tolist()))
+    ).all())
+    # Pull the non-empty cells out as plain lists before building rows
+    e, p = np.nonzero(total_shifts)
+    cells = zip(
+        employees[e].tolist(),
+        periods[p].astype(object).tolist(),
+        counts[e, p].tolist(),
+        worked[e, p].tolist(),
+        total_shifts[e, p].tolist(),
+        total_hours[e, p].tolist(),
+    )
+    report["rows"] = [
+        {
+            "empleado_id": employee,
+            "nombre": names.get(employee, ""),
+            "periodo": periodo,
+            "turnos": dict(zip(TURNOS, shifts)),
+            "horas": dict(zip(TURNOS, hours_worked)),
+            "total_turnos": shift_total,
+            "total_horas": hour_total,
+        }
+        for employee, periodo, shifts, hours_worked, shift_total, hour_total in cells
+    ]
+    # One validation call for the whole report instead of one model per row
+    return WorkloadReport.model_validate(report)
+
+
+def render_csv(report: WorkloadReport) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for row in report.rows:
+        writer.writerow(
+            [row.empleado_id, row.nombre, row.periodo.isoformat()]
+            + [row.turnos[turno] for turno in TURNOS]
+            + [row.horas[turno] for turno in TURNOS]
+            + [row.total_turnos, row.total_horas]
+        )
+    return buffer.getvalue()
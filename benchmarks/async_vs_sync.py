@@ -0,0 +1,155 @@
+"""Side-by-side benchmark of sync vs async DB mode on GET /schedules/
+
+Builds a throwaway SQLite database, starts uvicorn once per mode
+(GADI_DB_ASYNC=0 / 1) and hammers the schedules list endpoint with a
+fixed number of concurrent clients.
+
+Usage:
+    python -m benchmarks.async_vs_sync --schedules 20000 --concurrency 64 --requests 2000
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import httpx
+from sqlmodel import Session, create_engine
+
+from app.migrations import upgrade
+from app.models.employee import Employee, RoleEnum
+from app.models.schedule import Schedule, TurnoEnum
+from app.models.user import User
+
+BENCH_EMAIL = "bench@gadi.com"
+BENCH_PASSWORD = "bench"
+
+
+def build_database(path: str, n_schedules: int, n_employees: int = 50) -> None:
+    # Imported here: callers such as http_suite set GADI_* before the app reads its settings
+    from app.security.passwords import password_context
+
+    engine = create_engine(f"sqlite:///{path}")
+    upgrade(engine)
+    turnos = list(TurnoEnum)
+    start = date(2024, 1, 1)
+    with Session(engine) as session:
+        session.execute(Employee.__table__.insert(), [
+            {"nombre": f"Empleado {i}", "email": f"e{i}@gadi.com", "role": RoleEnum.TRABAJADOR}
+            for i in range(1, n_employees + 1)
+        ])
+        if n_schedules:
+            session.execute(Schedule.__table__.insert(), [
+                {
+                    "empleado_id": i % n_employees + 1,
+                    "fecha": start + timedelta(days=i // n_employees),
+                    "turno": turnos[i % len(turnos)],
+                }
+                for i in range(n_schedules)
+            ])
+        session.add(User(
+            email=BENCH_EMAIL,
+            nombre="Bench",
+            role=RoleEnum.ADMINISTRADOR,
+            password_hash=password_context().hash(BENCH_PASSWORD),
+        ))
+        session.commit()
+    engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for(url: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server did not start: {url}")
+
+
+async def drive(base_url: str, params: dict, concurrency: int, total: int) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        login = await client.post("/auth/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        latencies = []
+        remaining = total
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                t0 = time.perf_counter()
+                r = await client.get("/schedules/", params=params, headers=headers)
+                r.raise_for_status()
+                latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def run_mode(db_path: str, use_async: bool, args) -> dict:
+    port = free_port()
+    env = dict(
+        os.environ,
+        GADI_DATABASE_URL=f"sqlite:///{db_path}",
+        GADI_DB_ASYNC="1" if use_async else "0",
+        GADI_APP_ENV="local",
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_for(base_url + "/health")
+        params = {"fecha_from": "2024-01-01", "fecha_to": (date(2024, 1, 1) + timedelta(days=args.days)).isoformat()}
+        return asyncio.run(drive(base_url, params, args.concurrency, args.requests))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--schedules", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=7, help="width of the fecha range queried")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        build_database(db_path, args.schedules)
+        print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for use_async in (False, True):
+            result = run_mode(db_path, use_async, args)
+            print(
+                f"{'async' if use_async else 'sync':<6} {result['rps']:>9.1f} "
+                f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
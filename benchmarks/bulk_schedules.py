@@ -0,0 +1,54 @@
+"""Bulk insert vs looping POST /schedules/ for the same batch
+
+Runs in-process against a throwaway SQLite database.
+
+Usage:
+    python -m benchmarks.bulk_schedules --rows 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp()
+    db_path = os.path.join(tmp, "bench.db")
+    os.environ["GADI_DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    from fastapi.testclient import TestClient
+    from benchmarks.async_vs_sync import BENCH_EMAIL, BENCH_PASSWORD, build_database
+    from app.main import app
+
+    build_database(db_path, n_schedules=0)
+    def batch(start: date) -> list:
+        return [
+            {"empleado_id": i % 50 + 1, "fecha": (start + timedelta(days=i // 50)).isoformat(), "turno": "tarde"}
+            for i in range(args.rows)
+        ]
+
+    with TestClient(app) as client:
+        login = client.post("/auth/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD})
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        t0 = time.perf_counter()
+        for item in batch(date(2030, 1, 1)):
+            client.post("/schedules/", json=item, headers=headers).raise_for_status()
+        single = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        client.post("/schedules/bulk", json={"items": batch(date(2031, 1, 1))}, headers=headers).raise_for_status()
+        bulk = time.perf_counter() - t0
+
+    print(f"POST /schedules/ x{args.rows}: {single:.3f}s ({args.rows / single:.0f} filas/s)")
+    print(f"POST /schedules/bulk:        {bulk:.3f}s ({args.rows / bulk:.0f} filas/s)")
+    print(f"speedup: {single / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Cold-start benchmark: import time, time-to-first-request and RSS per worker
+
+Starts uvicorn against a migrated throwaway database several times and reports
+the medians of:
+
+    import      python -c "import app.main" in a fresh interpreter
+    first /health  from process spawn until GET /health answers 200
+    first login    POST /auth/login right after (loads passlib, bcrypt and jose)
+    RSS            resident memory of each worker after /health and after the login
+
+Usage:
+    python -m benchmarks.cold_start --runs 5
+    python -m benchmarks.cold_start --workers 4 --app-env prod
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+import httpx
+
+from benchmarks.async_vs_sync import BENCH_EMAIL, BENCH_PASSWORD, build_database, free_port
+
+
+def rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def worker_pids(pid: int) -> List[int]:
+    """uvicorn --workers N runs the app in child processes; a single worker is the process itself"""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            children = [int(child) for child in f.read().split()]
+    except OSError:
+        children = []
+    # The supervisor also owns a multiprocessing resource tracker; workers are the larger ones
+    workers = [child for child in children if rss_mb(child) > 30]
+    return workers or [pid]
+
+
+def import_ms(env: dict) -> float:
+    code = "import time; t = time.perf_counter(); import app.main; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip())
+
+
+def wait_ready(client: httpx.Client, url: str, timeout: float = 60.0) -> None:
+    # One client for every poll: building one per attempt loads the CA bundle and steals CPU from the server
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if client.get(url).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.005)
+    raise RuntimeError(f"server did not start: {url}")
+
+
+def run_once(env: dict, workers: int) -> dict:
+    port = free_port()
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"]
+    if workers > 1:
+        command += ["--workers", str(workers)]
+    base_url = f"http://127.0.0.1:{port}"
+
+    client = httpx.Client(base_url=base_url, timeout=60)
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(command, env=env)
+    try:
+        wait_ready(client, "/health")
+        first_request = time.perf_counter() - t0
+        if workers > 1:
+            time.sleep(1)  # Let every worker finish booting before sampling memory
+        pids = worker_pids(proc.pid)
+        rss_idle = [rss_mb(pid) for pid in pids]
+
+        t1 = time.perf_counter()
+        login = client.post("/auth/login", json={"email": BENCH_EMAIL, "password": BENCH_PASSWORD})
+        login.raise_for_status()
+        first_login = time.perf_counter() - t1
+        rss_login = max(rss_mb(pid) for pid in pids)
+    finally:
+        client.close()
+        proc.terminate()
+        proc.wait()
+
+    return {
+        "first_request_ms": first_request * 1000,
+        "first_login_ms": first_login * 1000,
+        "rss_idle_mb": statistics.mean(rss_idle),
+        "rss_after_login_mb": rss_login,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--app-env", default="local", choices=["local", "prod"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "cold.db")
+        build_database(db_path, n_schedules=0)
+        env = dict(
+            os.environ,
+            GADI_DATABASE_URL=f"sqlite:///{db_path}",
+            GADI_APP_ENV=args.app_env,
+            GADI_SECRET_KEY=os.environ.get("GADI_SECRET_KEY", "cold-start-benchmark"),
+        )
+        imports = [import_ms(env) for _ in range(args.runs)]
+        runs = [run_once(env, args.workers) for _ in range(args.runs)]
+
+    print(f"{args.runs} arranques, {args.workers} worker(s), APP_ENV={args.app_env} (medianas)")
+    print(f"  import app.main:      {statistics.median(imports):8.0f} ms")
+    for key, label, unit in [
+        ("first_request_ms", "primer /health:", "ms"),
+        ("first_login_ms", "primer login:", "ms"),
+        ("rss_idle_mb", "RSS por worker:", "MB"),
+        ("rss_after_login_mb", "RSS tras login:", "MB"),
+    ]:
+        print(f"  {label:<21} {statistics.median(run[key] for run in runs):8.1f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
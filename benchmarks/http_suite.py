@@ -0,0 +1,247 @@
+"""HTTP benchmark suite: throughput and latency percentiles per endpoint
+
+Generates a large database with the synthetic seeder, then drives the API
+either in-process through the ASGI transport or over a real uvicorn socket
+and runs the scenarios below with a fixed number of concurrent clients:
+
+    login   POST /auth/login with random generated users (bcrypt bound)
+    reads   GET /schedules/ for random 7-day windows and GET /schedules/summary
+    bulk    POST /schedules/bulk with 100 schedules per request
+    mixed   90% reads of schedules/tasks/employees, 10% POST /schedules/
+
+Results are printed and, with --output, written as JSON (commit, parameters,
+req/s and p50/p95/p99 per scenario and endpoint) so runs can be compared.
+
+Usage:
+    python -m benchmarks.http_suite --employees 2740 --days 365 --output bench.json
+    python -m benchmarks.http_suite --transport uvicorn --workers 2 --scenarios reads mixed
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List
+
+import httpx
+
+from benchmarks.async_vs_sync import free_port, wait_for
+
+SCENARIOS = ("login", "reads", "bulk", "mixed")
+START = date(2024, 1, 1)
+PASSWORD = "bench"
+SEED = 1
+BULK_SIZE = 100
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples: Dict[str, List[float]], errors: Dict[str, int], elapsed: float) -> dict:
+    endpoints = {}
+    for label, latencies in sorted(samples.items()):
+        latencies.sort()
+        endpoints[label] = {
+            "requests": len(latencies),
+            "errors": errors.get(label, 0),
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        }
+    total = sum(len(v) for v in samples.values())
+    return {"requests": total, "seconds": round(elapsed, 3), "rps": round(total / elapsed, 1), "endpoints": endpoints}
+
+
+async def run_scenario(client: httpx.AsyncClient, make_request: Callable, concurrency: int, total: int) -> dict:
+    """Run total requests from concurrency workers; make_request(i) returns (label, coroutine)"""
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    counter = iter(range(total))
+
+    async def worker():
+        for i in counter:
+            label, request = make_request(i)
+            t0 = time.perf_counter()
+            response = await request
+            samples[label].append(time.perf_counter() - t0)
+            if response.status_code >= 400:
+                errors[label] += 1
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(samples, errors, time.perf_counter() - t0)
+
+
+async def run_suite(client: httpx.AsyncClient, args) -> dict:
+    rng = random.Random(SEED)
+    admin = {"email": f"usuario{SEED}.0@carga.example.com", "password": PASSWORD}
+    login = await client.post("/auth/login", json=admin)
+    login.raise_for_status()
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    employee_ids = list(range(1, args.employees + 1))
+    first_free_day = START + timedelta(days=args.days + 1)  # Writes go after the generated range
+
+    def window():
+        start = START + timedelta(days=rng.randrange(max(args.days - 7, 1)))
+        return {"fecha_from": start.isoformat(), "fecha_to": (start + timedelta(days=6)).isoformat()}
+
+    def login_request(i):
+        user = {"email": f"usuario{SEED}.{rng.randrange(args.users)}@carga.example.com", "password": PASSWORD}
+        return "POST /auth/login", client.post("/auth/login", json=user)
+
+    def read_request(i):
+        if i % 4 == 3:
+            params = window()
+            params = {"from": params["fecha_from"], "to": params["fecha_to"], "group": "day"}
+            return "GET /schedules/summary", client.get("/schedules/summary", params=params, headers=headers)
+        return "GET /schedules/", client.get("/schedules/", params=window(), headers=headers)
+
+    def bulk_request(i):
+        fecha = (first_free_day + timedelta(days=i)).isoformat()
+        employees = rng.sample(employee_ids, min(BULK_SIZE, len(employee_ids)))
+        items = [{"empleado_id": e, "fecha": fecha, "turno": "tarde"} for e in employees]
+        return "POST /schedules/bulk", client.post(
+            "/schedules/bulk", json={"items": items, "partial": True}, headers=headers
+        )
+
+    def mixed_request(i):
+        if i % 10 == 9:
+            # Unique day per write, far past the bulk scenario, so writes never conflict
+            fecha = (first_free_day + timedelta(days=10000 + i)).isoformat()
+            body = {"empleado_id": rng.choice(employee_ids), "fecha": fecha, "turno": "mañana"}
+            return "POST /schedules/", client.post("/schedules/", json=body, headers=headers)
+        kind = i % 3
+        if kind == 0:
+            return "GET /schedules/", client.get("/schedules/", params=window(), headers=headers)
+        if kind == 1:
+            return "GET /tasks/", client.get("/tasks/")
+        return "GET /employees/", client.get("/employees/", headers=headers)
+
+    makers = {"login": login_request, "reads": read_request, "bulk": bulk_request, "mixed": mixed_request}
+    results = {}
+    for name in args.scenarios:
+        total = args.login_requests if name == "login" else args.requests
+        results[name] = await run_scenario(client, makers[name], args.concurrency, total)
+        print_scenario(name, results[name])
+    return results
+
+
+def print_scenario(name: str, result: dict) -> None:
+    print(f"\n{name}: {result['requests']} peticiones en {result['seconds']} s ({result['rps']} req/s)")
+    print(f"  {'endpoint':<24} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errores':>8}")
+    for label, stats in result["endpoints"].items():
+        print(
+            f"  {label:<24} {stats['rps']:>8} {stats['p50_ms']:>9} {stats['p95_ms']:>9} "
+            f"{stats['p99_ms']:>9} {stats['errors']:>8}"
+        )
+
+
+async def run_asgi(args) -> dict:
+    # Settings are read on first import, so the app is imported only after the env points at the database
+    from app.main import app
+
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            return await run_suite(client, args)
+    finally:
+        await app.router.shutdown()
+
+
+def run_uvicorn(args) -> dict:
+    port = free_port()
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"]
+    if args.workers > 1:
+        command += ["--workers", str(args.workers)]
+    proc = subprocess.Popen(command, env=os.environ.copy())
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_for(base_url + "/health")
+
+        async def drive():
+            limits = httpx.Limits(max_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+                return await run_suite(client, args)
+
+        return asyncio.run(drive())
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--employees", type=int, default=500)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="per scenario")
+    parser.add_argument("--login-requests", type=int, default=100, help="logins are bcrypt bound")
+    parser.add_argument("--db-async", action="store_true", help="run the app with GADI_DB_ASYNC=1")
+    parser.add_argument("--database", help="reuse an existing database instead of generating one")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.database or os.path.join(tmp, "bench.db")
+        os.environ.update(
+            GADI_DATABASE_URL=f"sqlite:///{db_path}",
+            GADI_DB_ASYNC="1" if args.db_async else "0",
+            GADI_APP_ENV="local",
+        )
+        os.environ.pop("GADI_ASYNC_DATABASE_URL", None)
+        if not args.database:
+            t0 = time.perf_counter()
+            subprocess.run([
+                sys.executable, "-m", "app.seed", "synthetic",
+                "--employees", str(args.employees), "--days", str(args.days), "--users", str(args.users),
+                "--start", START.isoformat(), "--seed", str(SEED), "--password", PASSWORD,
+            ], check=True, stdout=subprocess.DEVNULL)
+            print(f"base de datos generada en {time.perf_counter() - t0:.1f} s")
+
+        if args.transport == "asgi":
+            results = asyncio.run(run_asgi(args))
+        else:
+            results = run_uvicorn(args)
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "parameters": {k: v for k, v in vars(args).items() if k != "output"},
+            "scenarios": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nresultados escritos en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
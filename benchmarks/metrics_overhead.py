@@ -0,0 +1,72 @@
+"""Microbenchmark: per-request cost of the metrics middleware and engine hooks
+
+Serves GET /health (no database) and GET /tasks/{id} (one query, response cache
+off) in-process, alternating rounds with metrics disabled and enabled, and
+reports the mean latency of each.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 5000 --rounds 5
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+async def timed(client, path: str, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        await client.get(path)
+    return (time.perf_counter() - t0) / n
+
+
+async def run(args) -> None:
+    import httpx
+    from app.main import app
+    from app.metrics import metrics
+    from app.models.task import Task
+    from app.response_cache import response_cache
+    from sqlmodel import Session
+    from app.db import engine
+
+    await app.router.startup()
+    with Session(engine) as session:
+        task = Task(nombre="Benchmark")
+        session.add(task)
+        session.commit()
+        task_id = task.id
+    response_cache.enabled = False
+
+    paths = {"GET /health": "/health", "GET /tasks/{id}": f"/tasks/{task_id}"}
+    results = {label: {False: [], True: []} for label in paths}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, path in paths.items():
+            await timed(client, path, 200)  # Warm up
+            for _ in range(args.rounds):
+                for enabled in (False, True):
+                    metrics.enabled = enabled
+                    results[label][enabled].append(await timed(client, path, args.requests))
+    await app.router.shutdown()
+
+    for label, rounds in results.items():
+        off = min(rounds[False]) * 1e6
+        on = min(rounds[True]) * 1e6
+        print(f"{label:<16} sin métricas {off:>8.1f} µs  con métricas {on:>8.1f} µs  ({on - off:+.1f} µs)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000, help="per round and mode")
+    parser.add_argument("--rounds", type=int, default=5, help="the best round of each mode is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["GADI_DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'metrics.db')}"
+        os.environ["GADI_DB_ASYNC"] = "0"
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
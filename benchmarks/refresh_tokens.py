@@ -0,0 +1,44 @@
+"""Microbenchmark: /auth/login (bcrypt verify) vs /auth/refresh on a scratch database
+
+Usage:
+    python -m benchmarks.refresh_tokens --iterations 50
+"""
+import argparse
+import os
+import tempfile
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["GADI_DATABASE_URL"] = f"sqlite:///{path}"
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.security.revocation import revocation_store
+
+    credentials = {"email": "admin@gadi.com", "password": "admin123"}
+    with TestClient(app) as client:
+        client.post("/admin/seed")
+
+        t0 = time.perf_counter()
+        for _ in range(args.iterations):
+            refresh_token = client.post("/auth/login", json=credentials).json()["refresh_token"]
+        login = (time.perf_counter() - t0) / args.iterations
+
+        t0 = time.perf_counter()
+        for _ in range(args.iterations):
+            response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+            refresh_token = response.json()["refresh_token"]
+        refresh = (time.perf_counter() - t0) / args.iterations
+
+    print(f"login:   {login * 1000:>8.2f} ms/petición")
+    print(f"refresh: {refresh * 1000:>8.2f} ms/petición ({login / refresh:.1f}x)")
+    print(revocation_store.stats())
+
+
+if __name__ == "__main__":
+    main()
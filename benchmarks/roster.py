@@ -0,0 +1,57 @@
+"""Time the roster generator on a large plan
+
+Builds a throwaway database with N employees and generates a D-day
+roster through generate_roster (planning + batched insert).
+
+Usage:
+    python -m benchmarks.roster --employees 200 --days 90
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlmodel import Session, create_engine
+
+from app.models.schedule import RosterRequest, TurnoEnum
+from app.services.roster import generate_roster
+from benchmarks.async_vs_sync import build_database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--per-shift", type=int, default=40, help="coverage required per turno and day")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        build_database(db_path, n_schedules=0, n_employees=args.employees)
+        engine = create_engine(f"sqlite:///{db_path}")
+        start = date(2030, 1, 7)
+        request = RosterRequest(
+            fecha_from=start,
+            fecha_to=start + timedelta(days=args.days - 1),
+            coverage={turno: args.per_shift for turno in TurnoEnum},
+        )
+
+        with Session(engine) as session:
+            t0 = time.perf_counter()
+            plan = generate_roster(session, request.model_copy(update={"dry_run": True}))
+            planned = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            result = generate_roster(session, request)
+            written = time.perf_counter() - t0
+
+        missing = sum(s.missing for s in result.shortfalls)
+        print(f"{args.employees} empleados x {args.days} dias")
+        print(f"plan (dry_run): {planned:.3f}s, {len(plan.items)} turnos")
+        print(f"plan + insert:  {written:.3f}s, {result.created} turnos creados, {missing} puestos sin cubrir")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
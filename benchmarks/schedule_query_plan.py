@@ -0,0 +1,70 @@
+"""Query-plan check for the filtered schedule list
+
+Creates a schedule table the way old gadi.db files have it (no indexes),
+upgrades it in place with the schedule index migration and asserts that
+EXPLAIN QUERY PLAN for the list_schedules filters uses an index instead
+of scanning the table.
+
+Usage:
+    python -m benchmarks.schedule_query_plan
+"""
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlmodel import create_engine, select
+
+from app.migrations import m0002_schedule_indexes
+from app.models.schedule import Schedule, TurnoEnum
+from app.routers.schedules import filter_schedules
+
+LEGACY_DDL = """
+CREATE TABLE schedule (
+    fecha DATE NOT NULL,
+    turno VARCHAR(6) NOT NULL,
+    empleado_id INTEGER NOT NULL,
+    task_id INTEGER,
+    id INTEGER NOT NULL PRIMARY KEY
+)
+"""
+
+CASES = {
+    "empleado + rango": dict(empleado_id=7, fecha_from=date(2024, 3, 1), fecha_to=date(2024, 3, 31)),
+    "solo rango": dict(fecha_from=date(2024, 3, 1), fecha_to=date(2024, 3, 7)),
+}
+
+
+def query_plan(connection, **filters) -> str:
+    query = filter_schedules(select(Schedule), **filters)
+    sql = str(query.compile(connection, compile_kwargs={"literal_binds": True}))
+    rows = connection.execute(text("EXPLAIN QUERY PLAN " + sql)).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def main() -> int:
+    engine = create_engine("sqlite://")
+    turnos = [t.name for t in TurnoEnum]
+    with engine.begin() as connection:
+        connection.execute(text(LEGACY_DDL))
+        connection.execute(
+            Schedule.__table__.insert(),
+            [
+                {"empleado_id": i % 50, "fecha": date(2024, 1, 1) + timedelta(days=i // 50), "turno": turnos[i % 3]}
+                for i in range(20000)
+            ],
+        )
+        before = {name: query_plan(connection, **filters) for name, filters in CASES.items()}
+        m0002_schedule_indexes.upgrade(connection)
+        connection.execute(text("ANALYZE"))
+        after = {name: query_plan(connection, **filters) for name, filters in CASES.items()}
+
+    failed = False
+    for name in CASES:
+        uses_index = "INDEX ix_schedule_" in after[name]
+        failed |= not uses_index
+        print(f"{name}:\n  antes:   {before[name]}\n  despues: {after[name]}\n  {'OK' if uses_index else 'FALLO'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Microbenchmark: FastAPI's response_model path vs direct row serialization
+
+Builds 10k-row pages of ORM objects for each read schema and times the default
+path (validate against response_model, encode, JSONResponse.render) against
+app.serialization (ORM attributes straight to orjson bytes), reporting wall and
+CPU time per page.
+
+Usage:
+    python -m benchmarks.serialization --rows 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.main import app
+from app.models.employee import Employee, RoleEnum
+from app.models.schedule import Schedule, TurnoEnum
+from app.models.task import Task
+from app.models.user import User
+from app.pagination import Page
+from app.serialization import FastJSONResponse, employee_json, orjson, schedule_json, task_json, user_json
+
+
+def build_rows(n: int):
+    roles = list(RoleEnum)
+    turnos = list(TurnoEnum)
+    start = date(2024, 1, 1)
+    return {
+        "/employees/": (employee_json, [
+            Employee(id=i, nombre=f"Empleado {i}", email=f"empleado{i}@example.com", role=roles[i % len(roles)])
+            for i in range(1, n + 1)
+        ]),
+        "/schedules/": (schedule_json, [
+            Schedule(id=i, fecha=start + timedelta(days=i % 365), turno=turnos[i % 3], empleado_id=i % 500 + 1)
+            for i in range(1, n + 1)
+        ]),
+        "/tasks/": (task_json, [
+            Task(id=i, nombre=f"Tarea {i}", descripcion="Descripción de la tarea", activo=i % 2 == 0)
+            for i in range(1, n + 1)
+        ]),
+        "/api/v1/users/": (user_json, [
+            User(id=i, email=f"usuario{i}@example.com", nombre=f"Usuario {i}", role=roles[i % len(roles)],
+                 employee_id=i, password_hash="x")
+            for i in range(1, n + 1)
+        ]),
+    }
+
+
+def response_field(path: str):
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route.response_field
+    raise LookupError(path)
+
+
+def timed(fn, repeat: int):
+    best_wall = best_cpu = float("inf")
+    for _ in range(repeat):
+        w0, c0 = time.perf_counter(), time.process_time()
+        fn()
+        best_wall = min(best_wall, time.perf_counter() - w0)
+        best_cpu = min(best_cpu, time.process_time() - c0)
+    return best_wall * 1000, best_cpu * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20, help="the best run of each path is reported")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    print(f"{args.rows} filas por página; orjson {'disponible' if orjson else 'no instalado'}")
+    print(f"{'endpoint':<16} {'response_model ms (cpu)':>24} {'directo ms (cpu)':>18} {'cpu ahorrada':>13}")
+    for path, (serializer, rows) in build_rows(args.rows).items():
+        page = Page(items=rows, next_cursor="WyIyMDI0LTAxLTAxIiwgMV0")
+        field = response_field(path)
+
+        def default_path():
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=page, is_coroutine=True)
+            )
+            JSONResponse(content)
+
+        def fast_path():
+            serializer.page(page)
+
+        assert orjson is None or FastJSONResponse(
+            loop.run_until_complete(serialize_response(field=field, response_content=page, is_coroutine=True))
+        ).body == serializer.page(page), path
+        slow_wall, slow_cpu = timed(default_path, args.repeat)
+        fast_wall, fast_cpu = timed(fast_path, args.repeat)
+        print(
+            f"{path:<16} {slow_wall:>13.1f} ({slow_cpu:>6.1f}) {fast_wall:>9.1f} ({fast_cpu:>5.1f}) "
+            f"{1 - fast_cpu / slow_cpu:>12.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Microbenchmark: decode_token with and without the verified-token cache
+
+Usage:
+    python -m benchmarks.token_decode --iterations 20000 --tokens 100
+"""
+import argparse
+import time
+
+from app.security.jwt import create_access_token, decode_token, token_cache
+
+
+def run(tokens, iterations: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(iterations):
+        decode_token(tokens[i % len(tokens)])
+    return iterations / (time.perf_counter() - t0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--tokens", type=int, default=100, help="distinct tokens cycled through")
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": str(i)}, expires_minutes=30) for i in range(args.tokens)]
+
+    token_cache.enabled = False
+    uncached = run(tokens, args.iterations)
+
+    token_cache.enabled = True
+    token_cache.clear()
+    cached = run(tokens, args.iterations)
+
+    print(f"sin cache: {uncached:>10.0f} decodificaciones/s")
+    print(f"con cache: {cached:>10.0f} decodificaciones/s ({cached / uncached:.1f}x)")
+    print(token_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
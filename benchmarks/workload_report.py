@@ -0,0 +1,55 @@
+"""Time /reports/workload aggregation and serialization on a large database
+
+Builds a throwaway database with one schedule per employee and day starting
+2024-01-01 and reports a full year by week and by month.
+
+Usage:
+    python -m benchmarks.workload_report --employees 300 --schedules 109500
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+from sqlmodel import Session, create_engine
+
+from app.models.report import WorkloadPeriod
+from app.services.workload import render_csv, workload_report
+from benchmarks.async_vs_sync import build_database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=300)
+    parser.add_argument("--schedules", type=int, default=109500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        build_database(db_path, args.schedules, n_employees=args.employees)
+        engine = create_engine(f"sqlite:///{db_path}")
+
+        with Session(engine) as session:
+            for period in WorkloadPeriod:
+                best = float("inf")
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    report = workload_report(session, date(2024, 1, 1), date(2024, 12, 31), period)
+                    best = min(best, time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                report.model_dump_json()
+                as_json = time.perf_counter() - t0
+                t0 = time.perf_counter()
+                render_csv(report)
+                as_csv = time.perf_counter() - t0
+                print(
+                    f"{period.value:>5}: {len(report.rows):>6} filas, agregación {best * 1000:.0f} ms, "
+                    f"json {as_json * 1000:.0f} ms, csv {as_csv * 1000:.0f} ms"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
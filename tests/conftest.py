@@ -0,0 +1,30 @@
+import os
+import tempfile
+
+# Settings and engines are built at import time, so point them at a scratch database first
+_db_dir = tempfile.mkdtemp(prefix="gadi-tests-")
+os.environ["GADI_DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ["GADI_APP_ENV"] = "local"
+os.environ["GADI_DB_ASYNC"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+ADMIN_EMAIL = "admin@gadi.com"
+ADMIN_PASSWORD = "admin123"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as client:
+        client.post("/admin/seed")
+        yield client
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    response = client.post("/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+    assert response.status_code == 200
+    return {"Authorization": "Bearer " + response.json()["access_token"]}
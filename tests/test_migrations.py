@@ -0,0 +1,30 @@
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel
+
+import app.main  # noqa: F401  Registers every table model
+from app.config import get_settings
+from app.migrations import LATEST_VERSION, SCHEDULE_SLOT_INDEX, check_schema, schema_version, upgrade
+
+
+def test_migrations_build_the_model_schema(tmp_path):
+    """A model change without a migration fails here"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    upgrade(engine)
+    inspector = inspect(engine)
+    for table in SQLModel.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert columns == set(table.columns.keys()), table.name
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert {index.name for index in table.indexes} <= indexes, table.name
+    with engine.connect() as connection:
+        assert schema_version(connection) == LATEST_VERSION
+    assert upgrade(engine) == []
+
+
+def test_check_schema_creates_the_unique_slot_index(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'current.db'}")
+    upgrade(engine)
+    monkeypatch.setattr(get_settings(), "SCHEDULE_UNIQUE_SLOT", True)
+    check_schema(engine)
+    indexes = {index["name"] for index in inspect(engine).get_indexes("schedule")}
+    assert SCHEDULE_SLOT_INDEX in indexes
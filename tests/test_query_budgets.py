@@ -0,0 +1,50 @@
+import pytest
+
+from app.models.task import Task
+from app.query_budget import QueryBudgetExceeded, query_budget
+from app.response_cache import response_cache
+from app.security.deps import principal_cache
+
+
+@pytest.fixture
+def cold_caches():
+    """Budgets hold for the worst case: no cached principal or response"""
+    principal_cache.clear()
+    response_cache.invalidate(Task)
+
+
+@pytest.fixture(scope="module")
+def task_id(client, admin_headers):
+    response = client.post("/tasks/", json={"nombre": "Presupuesto"}, headers=admin_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_get_task_budget(client, admin_headers, task_id, cold_caches):
+    # Principal, table version, row
+    with query_budget(3, route="/tasks/{task_id}"):
+        assert client.get(f"/tasks/{task_id}", headers=admin_headers).status_code == 200
+
+
+def test_list_schedules_budget(client, admin_headers, cold_caches):
+    # Principal, table version, one keyset page
+    with query_budget(3, route="/schedules/"):
+        assert client.get("/schedules/", headers=admin_headers).status_code == 200
+
+
+def test_me_budget(client, admin_headers, cold_caches):
+    with query_budget(1, route="/auth/me"):
+        assert client.get("/auth/me", headers=admin_headers).status_code == 200
+
+
+def test_budget_exceeded(client, admin_headers, task_id, cold_caches):
+    with pytest.raises(QueryBudgetExceeded, match=r"GET /tasks/\{task_id\} ejecutó \d+ consultas \(máximo 0\)"):
+        with query_budget(0, route="/tasks/{task_id}"):
+            client.get(f"/tasks/{task_id}", headers=admin_headers)
+
+
+def test_budget_ignores_other_routes(client, admin_headers, task_id):
+    with query_budget(0, route="/health") as capture:
+        client.get(f"/tasks/{task_id}", headers=admin_headers)
+        client.get("/health")
+    assert capture.queries > 0
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.db import engine
+from app.models.token import RevokedToken
+from app.security.revocation import RevocationStore
+
+
+def test_store_grows_past_capacity_without_rebuilding_on_every_lookup(client):
+    expires = datetime.utcnow() + timedelta(days=14)
+    store = RevocationStore(capacity=5, error_rate=0.01, sync_seconds=0)
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    with Session(engine) as session:
+        for i in range(8):
+            session.add(RevokedToken(jti=f"cap-{i}", user_id=1, expires_at=expires))
+        session.commit()
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            assert store.is_revoked(session, "cap-0")  # First sync rebuilds once
+            assert store.stats()["capacity"] >= 16
+            statements.clear()
+            for _ in range(5):
+                store.is_revoked(session, "desconocido")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    assert "DELETE" not in statements
+    # One incremental sync per lookup (sync_seconds=0), plus rare false-positive table checks
+    assert len(statements) <= 10
@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def employee_id(client, admin_headers, request):
+    email = f"roster-{request.node.name}@example.com"
+    response = client.post(
+        "/employees/", json={"nombre": "Turnos", "email": email, "role": "Trabajador"}, headers=admin_headers
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _add_shifts(client, headers, employee_id, fechas):
+    for fecha in fechas:
+        response = client.post(
+            "/schedules/", json={"fecha": fecha, "turno": "tarde", "empleado_id": employee_id}, headers=headers
+        )
+        assert response.status_code == 201
+
+
+def _generate(client, headers, employee_id, max_per_week):
+    response = client.post("/schedules/generate", json={
+        "fecha_from": "2027-01-04",
+        "fecha_to": "2027-01-06",
+        "empleado_ids": [employee_id],
+        "coverage": {"mañana": 1},
+        "max_shifts_per_week": max_per_week,
+        "dry_run": True,
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_week_limit_counts_shifts_after_the_range(client, admin_headers, employee_id):
+    # Fri-Sun of the week of Monday 2027-01-04 are already taken
+    _add_shifts(client, admin_headers, employee_id, ["2027-01-08", "2027-01-09", "2027-01-10"])
+
+    result = _generate(client, admin_headers, employee_id, max_per_week=3)
+    assert result["items"] == []
+    assert len(result["shortfalls"]) == 3
+
+    result = _generate(client, admin_headers, employee_id, max_per_week=4)
+    assert [item["fecha"] for item in result["items"]] == ["2027-01-04"]
+
+
+def test_week_limit_counts_shifts_before_the_range(client, admin_headers, employee_id):
+    _add_shifts(client, admin_headers, employee_id, ["2027-01-04", "2027-01-05"])
+
+    result = _generate(client, admin_headers, employee_id, max_per_week=3)
+    # Range days with an existing shift are skipped, Wednesday is the third shift of the week
+    assert [item["fecha"] for item in result["items"]] == ["2027-01-06"]
@@ -0,0 +1,81 @@
+from datetime import date
+
+from sqlmodel import Session
+
+from app.db import engine
+from app.models.employee import Employee
+from app.models.schedule import Schedule, TurnoEnum
+from app.services.schedule_conflicts import ScheduleConflictIndex, conflict_index
+
+
+def _employee(session: Session, email: str) -> int:
+    employee = Employee(nombre="Conflictos", email=email, role="Trabajador")
+    session.add(employee)
+    session.commit()
+    return employee.id
+
+
+def test_index_loads_a_window_and_evicts_by_employee(client):
+    with Session(engine) as session:
+        first = _employee(session, "conflictos-1@example.com")
+        second = _employee(session, "conflictos-2@example.com")
+        near = Schedule(empleado_id=first, fecha=date(2028, 3, 1), turno=TurnoEnum.noche)
+        far = Schedule(empleado_id=first, fecha=date(2029, 3, 1), turno=TurnoEnum.tarde)
+        session.add_all([near, far])
+        session.commit()
+
+        index = ScheduleConflictIndex(ttl=60, window_days=7, max_employees=1)
+        index.load(session, [(first, date(2028, 3, 2))])
+        assert index.conflicts(first, date(2028, 3, 2), TurnoEnum.manana) == [near.id]
+        # Only the window around the write is in memory
+        assert list(index._windows[first].slots) == [(date(2028, 3, 1), TurnoEnum.noche)]
+
+        # A write a year later reloads the employee around the new date
+        index.load(session, [(first, date(2029, 3, 1))])
+        assert index.conflicts(first, date(2029, 3, 1), TurnoEnum.tarde) == [far.id]
+
+        index.load(session, [(second, date(2028, 3, 1))])
+        assert list(index._windows) == [second]
+
+
+def test_double_booking_returns_409(client, admin_headers):
+    with Session(engine) as session:
+        employee_id = _employee(session, "conflictos-api@example.com")
+    slot = {"fecha": "2028-05-01", "turno": "noche", "empleado_id": employee_id}
+    assert client.post("/schedules/", json=slot, headers=admin_headers).status_code == 201
+    assert client.post("/schedules/", json=slot, headers=admin_headers).status_code == 409
+    morning_after = {"fecha": "2028-05-02", "turno": "mañana", "empleado_id": employee_id}
+    assert client.post("/schedules/", json=morning_after, headers=admin_headers).status_code == 409
+
+
+def _create(client, headers, employee_id, fecha):
+    response = client.post(
+        "/schedules/", json={"fecha": fecha, "turno": "tarde", "empleado_id": employee_id}, headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_patch_onto_an_occupied_slot_with_a_cold_index(client, admin_headers):
+    with Session(engine) as session:
+        employee_id = _employee(session, "conflictos-patch@example.com")
+    _create(client, admin_headers, employee_id, "2035-01-02")
+    moved = _create(client, admin_headers, employee_id, "2035-01-01")
+
+    conflict_index.clear()  # As after the TTL or on another worker
+    response = client.patch(f"/schedules/{moved}", json={"fecha": "2035-01-02"}, headers=admin_headers)
+    assert response.status_code == 409
+
+
+def test_rejected_patch_leaves_the_index_intact(client, admin_headers):
+    with Session(engine) as session:
+        employee_id = _employee(session, "conflictos-rollback@example.com")
+    moved = _create(client, admin_headers, employee_id, "2035-02-01")
+    _create(client, admin_headers, employee_id, "2035-02-02")
+
+    conflict_index.clear()
+    response = client.patch(f"/schedules/{moved}", json={"fecha": "2035-02-02"}, headers=admin_headers)
+    assert response.status_code == 409
+    # The row is still at its original slot, so booking it again must clash
+    slot = {"fecha": "2035-02-01", "turno": "tarde", "empleado_id": employee_id}
+    assert client.post("/schedules/", json=slot, headers=admin_headers).status_code == 409
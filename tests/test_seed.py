@@ -0,0 +1,9 @@
+def test_synthetic_seed_reused_without_reset_is_409(client, admin_headers):
+    params = {"employees": 2, "tasks": 0, "users": 1, "days": 1, "seed": 987, "reset": False}
+    response = client.post("/admin/seed-synthetic", json=params, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["created"]["employees"] == 2
+
+    response = client.post("/admin/seed-synthetic", json=params, headers=admin_headers)
+    assert response.status_code == 409
+    assert "semilla 987" in response.json()["detail"]
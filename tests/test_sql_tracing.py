@@ -0,0 +1,26 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+import app.db
+from app.db import engine
+
+
+def test_failed_statements_leave_no_timing_state_on_the_connection():
+    with engine.connect() as connection:
+        for _ in range(5):
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM tabla_inexistente"))
+            connection.rollback()
+        assert not connection.info.get("query_start")
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_slow_statements_are_logged(monkeypatch, caplog):
+    monkeypatch.setattr(app.db, "SLOW_QUERY_SECONDS", 1e-9)
+    with caplog.at_level(logging.WARNING, logger="app.sql.slow"):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    assert any("Consulta lenta" in record.getMessage() for record in caplog.records)